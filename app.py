@@ -1,19 +1,97 @@
-from flask import Flask, render_template, request, jsonify, send_file
-import os
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+import orjson
+import hashlib
+import re
 import json
-from datetime import datetime
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime
+from functools import partial
 from property_parser import PropertyParser
 from municipality_lookup import MunicipalityLookup
 from policy_retrieval import PolicyRetrieval
-from report_generator import ReportGenerator
+
+def _json_default(obj):
+    """Serialize read-only mappings (such as municipality records) as objects"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """Serialize JSON responses with orjson, which also handles datetimes natively"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# In-process cache for repeated analyses; identical requests skip geocoding and
+# policy lookup for the timeout window
+ANALYSIS_CACHE_TIMEOUT = 300
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': ANALYSIS_CACHE_TIMEOUT})
 
 # Initialize components
 property_parser = PropertyParser()
 municipality_lookup = MunicipalityLookup()
 policy_retrieval = PolicyRetrieval()
-report_generator = ReportGenerator()
+
+# The municipality list never changes while the process runs, so serialize it once
+MUNICIPALITIES_JSON = orjson.dumps(municipality_lookup.get_supported_municipalities(), default=_json_default)
+MUNICIPALITIES_ETAG = hashlib.sha1(MUNICIPALITIES_JSON).hexdigest()
+
+# PDF reports are built in the background so request threads are not held
+# for the length of the render; jobs are tracked by ID until downloaded or expired.
+# Rendering is CPU-bound Python, so it runs in separate processes to stay off
+# the GIL that request threads share. Each web worker creates its own pool on
+# first use, so no pool queues are inherited across gunicorn's fork, and the
+# render processes are spawned fresh instead of forking a threaded worker
+REPORT_WORKERS = 2
+REPORT_START_METHOD = 'spawn'
+_report_executor = None
+_report_executor_pid = None
+_report_executor_lock = threading.Lock()
+
+# Report jobs are recorded as files named after the job ID, so whichever
+# worker receives a status or download request can answer it. Jobs older than
+# REPORT_JOB_TIMEOUT are expired, and renders still pending after
+# REPORT_RENDER_TIMEOUT are reported as failed
+REPORT_JOBS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reports', 'jobs')
+REPORT_JOB_TIMEOUT = 3600
+REPORT_RENDER_TIMEOUT = 120
+REPORT_JOB_STATES = ('pdf', 'error', 'pending')
+JOB_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+os.makedirs(REPORT_JOBS_DIR, exist_ok=True)
+
+# Rendered reports are kept in the analysis cache so repeat requests for the
+# same analysis skip ReportLab entirely
+REPORT_CACHE_TIMEOUT = 600
+
+# Size of each chunk written to the socket when streaming a report
+REPORT_CHUNK_SIZE = 64 * 1024
+
+# Zoning terms used to rate development potential
+HIGH_POTENTIAL_TERMS = frozenset({'residential', 'commercial', 'mixed'})
+MODERATE_POTENTIAL_TERMS = frozenset({'agricultural', 'rural'})
+ZONING_TOKEN_PATTERN = re.compile(r'[a-z]+')
 
 @app.route('/')
 def index():
@@ -26,6 +104,14 @@ def analyze_property():
     try:
         data = request.get_json()
         
+        # Reuse a recent analysis of the same request
+        cache_key = _analysis_cache_key(data)
+        cached_results = cache.get(cache_key)
+        if cached_results is not None:
+            results = orjson.loads(cached_results)
+            results['analysis_date'] = datetime.now()
+            return jsonify(results)
+        
         # Parse property information
         property_info = property_parser.parse_property_info(
             address=data.get('address', ''),
@@ -52,10 +138,13 @@ def analyze_property():
             'property_info': property_info,
             'municipality_info': municipality_info,
             'policy_info': policy_info,
-            'analysis_date': datetime.now().isoformat(),
             'feasibility_summary': _generate_feasibility_summary(policy_info)
         }
         
+        # Cached as JSON bytes since municipality records are read-only mappings
+        cache.set(cache_key, orjson.dumps(results, default=_json_default))
+        results['analysis_date'] = datetime.now()
+        
         return jsonify(results)
         
     except Exception as e:
@@ -63,27 +152,220 @@ def analyze_property():
 
 @app.route('/api/generate_report', methods=['POST'])
 def generate_report():
-    """Generate a PDF report for the property analysis"""
+    """Start generating a PDF report for the property analysis"""
     try:
         data = request.get_json()
         
-        # Generate PDF report
-        report_path = report_generator.create_report(data)
+        # Clear out jobs that were never downloaded
+        _expire_report_jobs()
+        
+        # Generate PDF report in the background, unless the same report was
+        # rendered recently, in which case the job is complete immediately
+        job_id = uuid.uuid4().hex
+        cache_key = _report_cache_key(data)
+        cached_report = cache.get(cache_key)
+        if cached_report is not None:
+            _write_job_file(job_id, 'pdf', cached_report)
+        else:
+            _write_job_file(job_id, 'pending', b'')
+            future = _submit_report(data)
+            future.add_done_callback(partial(_finish_report_job, job_id, cache_key))
+        
+        return jsonify({'job_id': job_id}), 202
         
-        return send_file(
-            report_path,
-            as_attachment=True,
-            download_name=f"land_use_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/report_status/<job_id>')
+def report_status(job_id):
+    """Check whether a report job has finished"""
+    state, age = _report_job_state(job_id)
+    
+    if state is None:
+        return jsonify({'error': 'Report job not found'}), 404
+    
+    if state == 'pending':
+        if age > REPORT_RENDER_TIMEOUT:
+            return jsonify({'status': 'failed', 'error': 'Report generation timed out'})
+        return jsonify({'status': 'pending'})
+    
+    if state == 'error':
+        try:
+            error = _read_job_file(job_id, 'error').decode()
+        except FileNotFoundError:
+            return jsonify({'error': 'Report job not found'}), 404
+        return jsonify({'status': 'failed', 'error': error})
+    
+    return jsonify({'status': 'complete'})
+
+@app.route('/api/report/<job_id>')
+def download_report(job_id):
+    """Download the PDF produced by a finished report job"""
+    state, _ = _report_job_state(job_id)
+    
+    if state is None:
+        return jsonify({'error': 'Report job not found'}), 404
+    
+    if state == 'pending':
+        return jsonify({'error': 'Report is still being generated'}), 409
+    
+    try:
+        if state == 'error':
+            raise RuntimeError(_read_job_file(job_id, 'error').decode())
+        
+        report_path = _job_path(job_id, 'pdf')
+        download_name = f"land_use_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        
+        response = Response(
+            _iter_file(report_path),
+            mimetype='application/pdf',
+            headers={
+                'Content-Disposition': f'attachment; filename={download_name}',
+                'Content-Length': str(os.path.getsize(report_path))
+            }
         )
         
+        # The job is finished with once the report has been sent
+        response.call_on_close(partial(_remove_job_files, job_id))
+        
+        return response
+        
+    except FileNotFoundError:
+        return jsonify({'error': 'Report job not found'}), 404
+    
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/municipalities')
 def get_municipalities():
     """Get list of supported municipalities"""
-    municipalities = municipality_lookup.get_supported_municipalities()
-    return jsonify(municipalities)
+    response = Response(MUNICIPALITIES_JSON, mimetype='application/json')
+    response.set_etag(MUNICIPALITIES_ETAG)
+    return response.make_conditional(request)
+
+def _analysis_cache_key(data):
+    """Build a cache key from the request body that ignores key order"""
+    signature = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return f"analysis:{hashlib.sha1(signature).hexdigest()}"
+
+def _get_report_executor():
+    """Get this process's report executor, creating it on first use"""
+    global _report_executor, _report_executor_pid
+    with _report_executor_lock:
+        if _report_executor is None or _report_executor_pid != os.getpid():
+            _report_executor = ProcessPoolExecutor(
+                max_workers=REPORT_WORKERS,
+                mp_context=multiprocessing.get_context(REPORT_START_METHOD)
+            )
+            _report_executor_pid = os.getpid()
+        return _report_executor
+
+def _discard_report_executor(executor):
+    """Drop a broken report executor so the next job starts a fresh pool"""
+    global _report_executor
+    with _report_executor_lock:
+        if _report_executor is executor:
+            _report_executor = None
+    executor.shutdown(wait=False)
+
+def _submit_report(data):
+    """Queue a report for rendering, replacing the pool if a render process died"""
+    # Imported on first use so ReportLab stays out of the preloaded master.
+    # render_report is sent to the pool by reference, so render processes
+    # import only report_generator, not this module
+    from report_generator import render_report
+    
+    executor = _get_report_executor()
+    try:
+        future = executor.submit(render_report, data)
+    except BrokenProcessPool:
+        _discard_report_executor(executor)
+        executor = _get_report_executor()
+        future = executor.submit(render_report, data)
+    
+    future.add_done_callback(partial(_check_report_executor, executor))
+    return future
+
+def _check_report_executor(executor, future):
+    """Replace the pool once a job reports that its render process died"""
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        _discard_report_executor(executor)
+
+def _report_cache_key(data):
+    """Build a cache key for a report; reports show today's date, so it is part of the key"""
+    signature = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return f"report:{date.today().isoformat()}:{hashlib.sha1(signature).hexdigest()}"
+
+def _finish_report_job(job_id, cache_key, future):
+    """Record the outcome of a render and keep successful reports for repeat requests"""
+    exception = future.exception()
+    if exception is None:
+        report_pdf = future.result()
+        cache.set(cache_key, report_pdf, timeout=REPORT_CACHE_TIMEOUT)
+        _write_job_file(job_id, 'pdf', report_pdf)
+    else:
+        _write_job_file(job_id, 'error', str(exception).encode())
+    
+    _remove_job_file(job_id, 'pending')
+
+def _job_path(job_id, state):
+    """Path of the file recording a report job in the given state"""
+    return os.path.join(REPORT_JOBS_DIR, f"{job_id}.{state}")
+
+def _write_job_file(job_id, state, content):
+    """Write a job file atomically so other workers never see it half-written"""
+    path = _job_path(job_id, state)
+    with open(f"{path}.tmp", 'wb') as f:
+        f.write(content)
+    os.replace(f"{path}.tmp", path)
+
+def _read_job_file(job_id, state):
+    """Read the contents of a job file"""
+    with open(_job_path(job_id, state), 'rb') as f:
+        return f.read()
+
+def _remove_job_file(job_id, state):
+    """Delete a job file if it still exists"""
+    try:
+        os.remove(_job_path(job_id, state))
+    except FileNotFoundError:
+        pass
+
+def _remove_job_files(job_id):
+    """Delete every file recorded for a report job"""
+    for state in REPORT_JOB_STATES:
+        _remove_job_file(job_id, state)
+
+def _iter_file(path):
+    """Yield a file in fixed-size chunks so it is never held in memory whole"""
+    with open(path, 'rb') as f:
+        yield from iter(lambda: f.read(REPORT_CHUNK_SIZE), b'')
+
+def _report_job_state(job_id):
+    """Find a report job's current state and its age in seconds, or (None, None) if unknown or expired"""
+    if not JOB_ID_PATTERN.fullmatch(job_id):
+        return None, None
+    
+    now = time.time()
+    for state in REPORT_JOB_STATES:
+        try:
+            age = now - os.path.getmtime(_job_path(job_id, state))
+        except FileNotFoundError:
+            continue
+        return (state, age) if age < REPORT_JOB_TIMEOUT else (None, None)
+    
+    return None, None
+
+def _expire_report_jobs():
+    """Delete job files older than REPORT_JOB_TIMEOUT"""
+    cutoff = time.time() - REPORT_JOB_TIMEOUT
+    with os.scandir(REPORT_JOBS_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                pass
 
 def _generate_feasibility_summary(policy_info):
     """Generate a feasibility summary based on policy information"""
@@ -94,12 +376,12 @@ def _generate_feasibility_summary(policy_info):
     }
     
     if policy_info.get('zoning'):
-        zoning = policy_info['zoning']
+        zoning_terms = set(ZONING_TOKEN_PATTERN.findall(policy_info['zoning'].lower()))
         
         # Analyze zoning for development potential
-        if any(term in zoning.lower() for term in ['residential', 'commercial', 'mixed']):
+        if zoning_terms & HIGH_POTENTIAL_TERMS:
             summary['development_potential'] = 'High'
-        elif any(term in zoning.lower() for term in ['agricultural', 'rural']):
+        elif zoning_terms & MODERATE_POTENTIAL_TERMS:
             summary['development_potential'] = 'Moderate'
         else:
             summary['development_potential'] = 'Low'
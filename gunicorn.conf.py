@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the Alberta Land Use Feasibility Tool
+Run with: gunicorn wsgi:app
+"""
+
+import multiprocessing
+
+bind = '0.0.0.0:5001'
+
+# Requests spend most of their time waiting on the geocoder, so threaded
+# workers let that network I/O overlap without making the routes async
+worker_class = 'gthread'
+workers = multiprocessing.cpu_count()
+threads = 8
+
+# Load the app (and the static municipality data) once in the master process
+# so workers share it copy-on-write. Nothing opens sockets or starts threads
+# at import time: HTTP sessions connect lazily, and each worker creates its own
+# report process pool on first use (app._get_report_executor checks the pid),
+# whose render processes are spawned rather than forked from the worker
+preload_app = True
+
+# Geocoding uses a 10 second timeout; leave headroom for report generation
+timeout = 60
@@ -1,8 +1,235 @@
 import json
+import math
 import os
-from typing import Dict, Optional, List
-import requests
-from geopy.distance import geodesic
+import re
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Tuple
+import numpy as np
+
+# Mean Earth radius used for haversine distances
+EARTH_RADIUS_KM = 6371.0
+
+# Municipalities further than this from a property are not considered a match
+MATCH_RADIUS_KM = 50.0
+
+# Latitude span of the match radius; nothing outside it can be within range
+MATCH_RADIUS_DEGREES = math.degrees(MATCH_RADIUS_KM / EARTH_RADIUS_KM)
+
+# Maximum number of distinct lookups remembered per MunicipalityLookup
+LOOKUP_CACHE_SIZE = 1024
+
+# Simplified township bands and the municipality covering each; earlier
+# bands win where the boundaries overlap
+LEGAL_TOWNSHIP_BANDS = (
+    (40, 50, 'Red Deer'),
+    (50, 60, 'Edmonton'),
+    (60, 70, 'Athabasca'),
+)
+LEGAL_RANGE_LIMITS = (20, 30)
+
+# Legal description types that carry a township and range
+LEGAL_SECTION_TYPES = frozenset(('quarter_section', 'section'))
+
+def _nearest_haversine(lat_rad: np.ndarray, lon_rad: np.ndarray, cos_lat: np.ndarray,
+                       lat: float, lon: float) -> Tuple[int, float]:
+    """Return the index of and distance in km to the point nearest (lat, lon)"""
+    query_lat = math.radians(lat)
+    sin_dlat = np.sin((lat_rad - query_lat) / 2)
+    sin_dlon = np.sin((lon_rad - math.radians(lon)) / 2)
+    a = sin_dlat * sin_dlat + math.cos(query_lat) * cos_lat * sin_dlon * sin_dlon
+    
+    # Distance grows monotonically with a, so only the winner needs the arcsin
+    idx = int(a.argmin())
+    return idx, 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a[idx]))
+
+def _freeze(value):
+    """Recursively wrap dictionaries in read-only mapping proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+# Static municipality dataset, frozen so every instance can share it safely
+MUNICIPALITIES_DATA = _freeze({
+    "cities": {
+        "Red Deer": {
+            "type": "city",
+            "population": 100844,
+            "coordinates": {"lat": 52.2681, "lon": -113.8112},
+            "website": "https://www.reddeer.ca",
+            "planning_dept": "planning@reddeer.ca",
+            "land_use_bylaw": "https://www.reddeer.ca/city-government/bylaws-and-policies/land-use-bylaw/",
+            "zoning_map": "https://www.reddeer.ca/city-services/planning-and-development/zoning-maps/",
+            "contact_info": {
+                "phone": "403-342-8111",
+                "address": "4914 48th Ave, Red Deer, AB T4N 3T4"
+            }
+        },
+        "Edmonton": {
+            "type": "city",
+            "population": 1010899,
+            "coordinates": {"lat": 53.5461, "lon": -113.4938},
+            "website": "https://www.edmonton.ca",
+            "planning_dept": "development@edmonton.ca",
+            "land_use_bylaw": "https://www.edmonton.ca/city_government/bylaws/zoning-bylaw",
+            "zoning_map": "https://maps.edmonton.ca/map.aspx?id=ZoningBylaw",
+            "contact_info": {
+                "phone": "311",
+                "address": "1 Sir Winston Churchill Square, Edmonton, AB T5J 2R7"
+            }
+        },
+        "Lacombe": {
+            "type": "city",
+            "population": 13057,
+            "coordinates": {"lat": 52.4675, "lon": -113.7364},
+            "website": "https://www.lacombe.ca",
+            "planning_dept": "planning@lacombe.ca",
+            "land_use_bylaw": "https://www.lacombe.ca/government/bylaws/",
+            "contact_info": {
+                "phone": "403-782-6666",
+                "address": "5432 56 Ave, Lacombe, AB T4L 1E9"
+            }
+        },
+        "Wetaskiwin": {
+            "type": "city",
+            "population": 12655,
+            "coordinates": {"lat": 52.9692, "lon": -113.3747},
+            "website": "https://www.wetaskiwin.ca",
+            "planning_dept": "planning@wetaskiwin.ca",
+            "land_use_bylaw": "https://www.wetaskiwin.ca/government/bylaws-policies/",
+            "contact_info": {
+                "phone": "780-361-4400",
+                "address": "4905 50 Ave, Wetaskiwin, AB T9A 0S7"
+            }
+        },
+        "Camrose": {
+            "type": "city",
+            "population": 18742,
+            "coordinates": {"lat": 53.0167, "lon": -112.8333},
+            "website": "https://www.camrose.ca",
+            "planning_dept": "planning@camrose.ca",
+            "land_use_bylaw": "https://www.camrose.ca/government/bylaws/",
+            "contact_info": {
+                "phone": "780-672-4428",
+                "address": "4703 50 Ave, Camrose, AB T4V 0P7"
+            }
+        },
+        "Athabasca": {
+            "type": "town",
+            "population": 2965,
+            "coordinates": {"lat": 54.7186, "lon": -113.2856},
+            "website": "https://www.athabasca.ca",
+            "planning_dept": "cao@athabasca.ca",
+            "land_use_bylaw": "https://www.athabasca.ca/government/bylaws/",
+            "contact_info": {
+                "phone": "780-675-2273",
+                "address": "4904 50 St, Athabasca, AB T9S 1E2"
+            }
+        }
+    },
+    "counties": {
+        "Lacombe County": {
+            "type": "county",
+            "coordinates": {"lat": 52.4000, "lon": -113.8000},
+            "website": "https://www.lacombecounty.com",
+            "planning_dept": "planning@lacombecounty.com",
+            "land_use_bylaw": "https://www.lacombecounty.com/government/bylaws/",
+            "contact_info": {
+                "phone": "403-782-8060",
+                "address": "4611 52 Ave, Lacombe, AB T4L 1G3"
+            }
+        },
+        "Ponoka County": {
+            "type": "county",
+            "coordinates": {"lat": 52.6833, "lon": -113.5833},
+            "website": "https://www.ponokacounty.com",
+            "planning_dept": "planning@ponokacounty.com",
+            "land_use_bylaw": "https://www.ponokacounty.com/government/bylaws/",
+            "contact_info": {
+                "phone": "403-783-3333",
+                "address": "5506 57 Ave, Ponoka, AB T4J 1A1"
+            }
+        },
+        "Wetaskiwin County": {
+            "type": "county",
+            "coordinates": {"lat": 53.0000, "lon": -113.5000},
+            "website": "https://www.county.wetaskiwin.ab.ca",
+            "planning_dept": "planning@county.wetaskiwin.ab.ca",
+            "land_use_bylaw": "https://www.county.wetaskiwin.ab.ca/government/bylaws/",
+            "contact_info": {
+                "phone": "780-352-3321",
+                "address": "Multi-Municipal Building, 4905 51 Ave, Wetaskiwin, AB T9A 1P2"
+            }
+        },
+        "Camrose County": {
+            "type": "county",
+            "coordinates": {"lat": 53.0000, "lon": -112.5000},
+            "website": "https://www.camrosecounty.ab.ca",
+            "planning_dept": "planning@camrosecounty.ab.ca",
+            "land_use_bylaw": "https://www.camrosecounty.ab.ca/government/bylaws/",
+            "contact_info": {
+                "phone": "780-672-4446",
+                "address": "#10, 3755 43 Ave, Camrose, AB T4V 3S8"
+            }
+        },
+        "Leduc County": {
+            "type": "county",
+            "coordinates": {"lat": 53.2667, "lon": -113.5500},
+            "website": "https://www.leduc-county.com",
+            "planning_dept": "planning@leduc-county.com",
+            "land_use_bylaw": "https://www.leduc-county.com/government/bylaws/",
+            "contact_info": {
+                "phone": "780-955-3555",
+                "address": "1101 5 St, Nisku, AB T9E 2X3"
+            }
+        },
+        "Strathcona County": {
+            "type": "county",
+            "coordinates": {"lat": 53.5167, "lon": -113.2000},
+            "website": "https://www.strathcona.ca",
+            "planning_dept": "planning@strathcona.ca",
+            "land_use_bylaw": "https://www.strathcona.ca/council-county/bylaws/",
+            "contact_info": {
+                "phone": "780-464-8111",
+                "address": "2001 Sherwood Dr, Sherwood Park, AB T8A 3W7"
+            }
+        },
+        "Sturgeon County": {
+            "type": "county",
+            "coordinates": {"lat": 53.8000, "lon": -113.6000},
+            "website": "https://www.sturgeoncounty.ca",
+            "planning_dept": "planning@sturgeoncounty.ca",
+            "land_use_bylaw": "https://www.sturgeoncounty.ca/government/bylaws/",
+            "contact_info": {
+                "phone": "780-939-4321",
+                "address": "9613 100 St, Morinville, AB T8R 1L9"
+            }
+        },
+        "Parkland County": {
+            "type": "county",
+            "coordinates": {"lat": 53.7000, "lon": -114.0000},
+            "website": "https://www.parklandcounty.com",
+            "planning_dept": "planning@parklandcounty.com",
+            "land_use_bylaw": "https://www.parklandcounty.com/government/bylaws/",
+            "contact_info": {
+                "phone": "780-968-8888",
+                "address": "53109A Hwy 779, Parkland County, AB T7Z 1R1"
+            }
+        },
+        "Athabasca County": {
+            "type": "county",
+            "coordinates": {"lat": 54.5000, "lon": -113.0000},
+            "website": "https://www.athabascacounty.com",
+            "planning_dept": "planning@athabascacounty.com",
+            "land_use_bylaw": "https://www.athabascacounty.com/government/bylaws/",
+            "contact_info": {
+                "phone": "780-675-2273",
+                "address": "4904 50 St, Athabasca, AB T9S 1E2"
+            }
+        }
+    }
+})
 
 class MunicipalityLookup:
     """Lookup municipality information for Alberta properties"""
@@ -10,190 +237,20 @@ class MunicipalityLookup:
     def __init__(self):
         self.municipalities_data = self._load_municipalities_data()
         self.supported_regions = self._get_supported_regions()
+        self._build_name_index()
+        self._build_township_index()
+        self._build_coordinate_arrays()
+        self._supported_municipalities = self._build_supported_municipalities()
+        
+        # Repeat queries are common across requests and the dataset is static
+        self._match_name = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._match_name_uncached)
+        self._find_municipality_cached = lru_cache(maxsize=LOOKUP_CACHE_SIZE)(self._find_municipality_uncached)
     
-    def _load_municipalities_data(self) -> Dict:
+    def _load_municipalities_data(self) -> Mapping:
         """Load municipality data from local database"""
         # This would typically load from a database or API
-        # For now, we'll use a comprehensive static dataset
-        return {
-            "cities": {
-                "Red Deer": {
-                    "type": "city",
-                    "population": 100844,
-                    "coordinates": {"lat": 52.2681, "lon": -113.8112},
-                    "website": "https://www.reddeer.ca",
-                    "planning_dept": "planning@reddeer.ca",
-                    "land_use_bylaw": "https://www.reddeer.ca/city-government/bylaws-and-policies/land-use-bylaw/",
-                    "zoning_map": "https://www.reddeer.ca/city-services/planning-and-development/zoning-maps/",
-                    "contact_info": {
-                        "phone": "403-342-8111",
-                        "address": "4914 48th Ave, Red Deer, AB T4N 3T4"
-                    }
-                },
-                "Edmonton": {
-                    "type": "city",
-                    "population": 1010899,
-                    "coordinates": {"lat": 53.5461, "lon": -113.4938},
-                    "website": "https://www.edmonton.ca",
-                    "planning_dept": "development@edmonton.ca",
-                    "land_use_bylaw": "https://www.edmonton.ca/city_government/bylaws/zoning-bylaw",
-                    "zoning_map": "https://maps.edmonton.ca/map.aspx?id=ZoningBylaw",
-                    "contact_info": {
-                        "phone": "311",
-                        "address": "1 Sir Winston Churchill Square, Edmonton, AB T5J 2R7"
-                    }
-                },
-                "Lacombe": {
-                    "type": "city",
-                    "population": 13057,
-                    "coordinates": {"lat": 52.4675, "lon": -113.7364},
-                    "website": "https://www.lacombe.ca",
-                    "planning_dept": "planning@lacombe.ca",
-                    "land_use_bylaw": "https://www.lacombe.ca/government/bylaws/",
-                    "contact_info": {
-                        "phone": "403-782-6666",
-                        "address": "5432 56 Ave, Lacombe, AB T4L 1E9"
-                    }
-                },
-                "Wetaskiwin": {
-                    "type": "city",
-                    "population": 12655,
-                    "coordinates": {"lat": 52.9692, "lon": -113.3747},
-                    "website": "https://www.wetaskiwin.ca",
-                    "planning_dept": "planning@wetaskiwin.ca",
-                    "land_use_bylaw": "https://www.wetaskiwin.ca/government/bylaws-policies/",
-                    "contact_info": {
-                        "phone": "780-361-4400",
-                        "address": "4905 50 Ave, Wetaskiwin, AB T9A 0S7"
-                    }
-                },
-                "Camrose": {
-                    "type": "city",
-                    "population": 18742,
-                    "coordinates": {"lat": 53.0167, "lon": -112.8333},
-                    "website": "https://www.camrose.ca",
-                    "planning_dept": "planning@camrose.ca",
-                    "land_use_bylaw": "https://www.camrose.ca/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-672-4428",
-                        "address": "4703 50 Ave, Camrose, AB T4V 0P7"
-                    }
-                },
-                "Athabasca": {
-                    "type": "town",
-                    "population": 2965,
-                    "coordinates": {"lat": 54.7186, "lon": -113.2856},
-                    "website": "https://www.athabasca.ca",
-                    "planning_dept": "cao@athabasca.ca",
-                    "land_use_bylaw": "https://www.athabasca.ca/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-675-2273",
-                        "address": "4904 50 St, Athabasca, AB T9S 1E2"
-                    }
-                }
-            },
-            "counties": {
-                "Lacombe County": {
-                    "type": "county",
-                    "coordinates": {"lat": 52.4000, "lon": -113.8000},
-                    "website": "https://www.lacombecounty.com",
-                    "planning_dept": "planning@lacombecounty.com",
-                    "land_use_bylaw": "https://www.lacombecounty.com/government/bylaws/",
-                    "contact_info": {
-                        "phone": "403-782-8060",
-                        "address": "4611 52 Ave, Lacombe, AB T4L 1G3"
-                    }
-                },
-                "Ponoka County": {
-                    "type": "county",
-                    "coordinates": {"lat": 52.6833, "lon": -113.5833},
-                    "website": "https://www.ponokacounty.com",
-                    "planning_dept": "planning@ponokacounty.com",
-                    "land_use_bylaw": "https://www.ponokacounty.com/government/bylaws/",
-                    "contact_info": {
-                        "phone": "403-783-3333",
-                        "address": "5506 57 Ave, Ponoka, AB T4J 1A1"
-                    }
-                },
-                "Wetaskiwin County": {
-                    "type": "county",
-                    "coordinates": {"lat": 53.0000, "lon": -113.5000},
-                    "website": "https://www.county.wetaskiwin.ab.ca",
-                    "planning_dept": "planning@county.wetaskiwin.ab.ca",
-                    "land_use_bylaw": "https://www.county.wetaskiwin.ab.ca/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-352-3321",
-                        "address": "Multi-Municipal Building, 4905 51 Ave, Wetaskiwin, AB T9A 1P2"
-                    }
-                },
-                "Camrose County": {
-                    "type": "county",
-                    "coordinates": {"lat": 53.0000, "lon": -112.5000},
-                    "website": "https://www.camrosecounty.ab.ca",
-                    "planning_dept": "planning@camrosecounty.ab.ca",
-                    "land_use_bylaw": "https://www.camrosecounty.ab.ca/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-672-4446",
-                        "address": "#10, 3755 43 Ave, Camrose, AB T4V 3S8"
-                    }
-                },
-                "Leduc County": {
-                    "type": "county",
-                    "coordinates": {"lat": 53.2667, "lon": -113.5500},
-                    "website": "https://www.leduc-county.com",
-                    "planning_dept": "planning@leduc-county.com",
-                    "land_use_bylaw": "https://www.leduc-county.com/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-955-3555",
-                        "address": "1101 5 St, Nisku, AB T9E 2X3"
-                    }
-                },
-                "Strathcona County": {
-                    "type": "county",
-                    "coordinates": {"lat": 53.5167, "lon": -113.2000},
-                    "website": "https://www.strathcona.ca",
-                    "planning_dept": "planning@strathcona.ca",
-                    "land_use_bylaw": "https://www.strathcona.ca/council-county/bylaws/",
-                    "contact_info": {
-                        "phone": "780-464-8111",
-                        "address": "2001 Sherwood Dr, Sherwood Park, AB T8A 3W7"
-                    }
-                },
-                "Sturgeon County": {
-                    "type": "county",
-                    "coordinates": {"lat": 53.8000, "lon": -113.6000},
-                    "website": "https://www.sturgeoncounty.ca",
-                    "planning_dept": "planning@sturgeoncounty.ca",
-                    "land_use_bylaw": "https://www.sturgeoncounty.ca/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-939-4321",
-                        "address": "9613 100 St, Morinville, AB T8R 1L9"
-                    }
-                },
-                "Parkland County": {
-                    "type": "county",
-                    "coordinates": {"lat": 53.7000, "lon": -114.0000},
-                    "website": "https://www.parklandcounty.com",
-                    "planning_dept": "planning@parklandcounty.com",
-                    "land_use_bylaw": "https://www.parklandcounty.com/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-968-8888",
-                        "address": "53109A Hwy 779, Parkland County, AB T7Z 1R1"
-                    }
-                },
-                "Athabasca County": {
-                    "type": "county",
-                    "coordinates": {"lat": 54.5000, "lon": -113.0000},
-                    "website": "https://www.athabascacounty.com",
-                    "planning_dept": "planning@athabascacounty.com",
-                    "land_use_bylaw": "https://www.athabascacounty.com/government/bylaws/",
-                    "contact_info": {
-                        "phone": "780-675-2273",
-                        "address": "4904 50 St, Athabasca, AB T9S 1E2"
-                    }
-                }
-            }
-        }
+        # For now, we'll use a comprehensive static dataset shared by all instances
+        return MUNICIPALITIES_DATA
     
     def _get_supported_regions(self) -> List[str]:
         """Get list of supported regions"""
@@ -202,7 +259,59 @@ class MunicipalityLookup:
             regions.extend(category.keys())
         return regions
     
-    def find_municipality(self, property_info: Dict) -> Optional[Dict]:
+    def _build_name_index(self):
+        """Index municipalities by lowercased name for fast name lookups"""
+        categories = {'cities': 'city', 'counties': 'county'}
+        
+        self._name_exact = {
+            municipality_name.lower(): (municipality_name, municipality_data, categories[category_name])
+            for category_name, category_data in self.municipalities_data.items()
+            for municipality_name, municipality_data in category_data.items()
+        }
+        # Cities come before counties so substring matches keep the same priority
+        self._name_items = list(self._name_exact.items())
+        
+        # One alternation over every name scans free text in a single pass;
+        # longer names go first so "Lacombe County" wins over "Lacombe"
+        names = sorted(self._name_exact, key=len, reverse=True)
+        self._name_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, names)) + r')\b', re.IGNORECASE)
+    
+    def _build_township_index(self):
+        """Map every township covered by LEGAL_TOWNSHIP_BANDS to its municipality"""
+        self._township_index = {}
+        for first_township, last_township, municipality_name in LEGAL_TOWNSHIP_BANDS:
+            match = self._name_exact[municipality_name.lower()]
+            for township in range(first_township, last_township + 1):
+                self._township_index.setdefault(township, match)
+    
+    def _build_coordinate_arrays(self):
+        """Flatten municipality coordinates into parallel arrays for vectorized distance queries"""
+        entries = []
+        
+        for category_name, category_data in self.municipalities_data.items():
+            for municipality_name, municipality_data in category_data.items():
+                muni_coords = municipality_data.get('coordinates')
+                if muni_coords:
+                    entries.append((
+                        muni_coords['lat'],
+                        muni_coords['lon'],
+                        municipality_name,
+                        category_name.rstrip('s'),  # Remove 's' from 'cities'/'counties'
+                        municipality_data
+                    ))
+        
+        # Sorted by latitude so queries can bisect down to the rows within range
+        entries.sort(key=lambda entry: entry[0])
+        
+        self._names = [entry[2] for entry in entries]
+        self._categories = [entry[3] for entry in entries]
+        self._refs = [entry[4] for entry in entries]
+        self._lat = np.array([entry[0] for entry in entries], dtype=np.float64)
+        self._lat_rad = np.radians(self._lat)
+        self._lon_rad = np.radians(np.array([entry[1] for entry in entries], dtype=np.float64))
+        self._cos_lat = np.cos(self._lat_rad)
+    
+    def find_municipality(self, property_info: Dict) -> Optional[ChainMap]:
         """
         Find the municipality for a given property
         
@@ -212,97 +321,107 @@ class MunicipalityLookup:
         Returns:
             Municipality information dictionary
         """
-        # Try different methods to identify municipality
+        coordinates = property_info.get('coordinates')
+        legal_desc = property_info.get('parsed_legal')
+        address = property_info.get('parsed_address')
+        
+        # Only the fields the lookup methods read make up the cache key
+        municipality = self._find_municipality_cached(
+            tuple(property_info.get('municipality_hints', [])),
+            (round(coordinates['latitude'], 4), round(coordinates['longitude'], 4)) if coordinates else None,
+            (legal_desc.get('type'), tuple(sorted(legal_desc.get('components', {}).items()))) if legal_desc else None,
+            address.get('full_address', '') if address else None
+        )
+        
+        # A fresh child map keeps callers' writes out of the cached result
+        return municipality.new_child() if municipality else None
+    
+    def _find_municipality_uncached(self, municipality_hints: Tuple[str, ...],
+                                    coordinates: Optional[Tuple[float, float]],
+                                    legal_desc: Optional[Tuple],
+                                    full_address: Optional[str]) -> Optional[ChainMap]:
+        """Run the municipality lookup methods in order of reliability"""
+        # Method 1: Check municipality hints from text, exact names before partial matches
+        for hint in municipality_hints:
+            match = self._name_exact.get(hint.lower())
+            if match:
+                return self._materialize(match)
         
-        # Method 1: Check municipality hints from text
-        municipality_hints = property_info.get('municipality_hints', [])
         for hint in municipality_hints:
             municipality = self._find_by_name(hint)
             if municipality:
                 return municipality
         
         # Method 2: Use coordinates if available
-        coordinates = property_info.get('coordinates')
         if coordinates:
-            municipality = self._find_by_coordinates(
-                coordinates['latitude'], 
-                coordinates['longitude']
-            )
+            municipality = self._find_by_coordinates(*coordinates)
             if municipality:
                 return municipality
         
         # Method 3: Try to geocode legal description
-        legal_desc = property_info.get('parsed_legal')
-        if legal_desc and legal_desc.get('type') != 'unknown':
-            municipality = self._find_by_legal_description(legal_desc)
+        if legal_desc and legal_desc[0] != 'unknown':
+            legal_type, components = legal_desc
+            municipality = self._find_by_legal_description({'type': legal_type, 'components': dict(components)})
             if municipality:
                 return municipality
         
         # Method 4: Fallback - try to extract from address components
-        address = property_info.get('parsed_address')
-        if address:
-            municipality = self._find_by_address_components(address)
+        if full_address is not None:
+            municipality = self._find_by_address_components({'full_address': full_address})
             if municipality:
                 return municipality
         
         return None
     
-    def _find_by_name(self, name: str) -> Optional[Dict]:
+    def _find_by_name(self, name: str) -> Optional[ChainMap]:
         """Find municipality by name"""
-        name_lower = name.lower()
-        
-        # Check cities first
-        for city_name, city_data in self.municipalities_data['cities'].items():
-            if city_name.lower() == name_lower or city_name.lower() in name_lower:
-                result = city_data.copy()
-                result['name'] = city_name
-                result['category'] = 'city'
-                return result
-        
-        # Check counties
-        for county_name, county_data in self.municipalities_data['counties'].items():
-            if county_name.lower() == name_lower or county_name.lower() in name_lower:
-                result = county_data.copy()
-                result['name'] = county_name
-                result['category'] = 'county'
-                return result
-        
-        return None
+        match = self._match_name(name.lower())
+        return self._materialize(match) if match else None
+    
+    def _materialize(self, match: Tuple[str, Mapping, str]) -> ChainMap:
+        """Build a municipality result from a name index entry without copying its data"""
+        municipality_name, municipality_data, category = match
+        return ChainMap({'name': municipality_name, 'category': category}, municipality_data)
+    
+    def _match_name_uncached(self, name_lower: str) -> Optional[Tuple[str, Dict, str]]:
+        """Match a lowercased name against the name index"""
+        # Exact name match first, then fall back to a name contained in the text
+        match = self._name_exact.get(name_lower)
+        if match is None:
+            match = next((entry for lower_name, entry in self._name_items if lower_name in name_lower), None)
+        return match
     
-    def _find_by_coordinates(self, lat: float, lon: float) -> Optional[Dict]:
+    def _find_by_coordinates(self, lat: float, lon: float) -> Optional[ChainMap]:
         """Find municipality by coordinates using proximity"""
-        closest_municipality = None
-        closest_distance = float('inf')
+        # Narrow to municipalities within the match radius in latitude
+        start = int(np.searchsorted(self._lat, lat - MATCH_RADIUS_DEGREES, side='left'))
+        end = int(np.searchsorted(self._lat, lat + MATCH_RADIUS_DEGREES, side='right'))
+        if start == end:
+            return None
         
-        # Check all municipalities
-        for category_name, category_data in self.municipalities_data.items():
-            for municipality_name, municipality_data in category_data.items():
-                muni_coords = municipality_data.get('coordinates')
-                if muni_coords:
-                    distance = geodesic(
-                        (lat, lon),
-                        (muni_coords['lat'], muni_coords['lon'])
-                    ).kilometers
-                    
-                    # Consider within 50km as potential match
-                    if distance < 50 and distance < closest_distance:
-                        closest_distance = distance
-                        result = municipality_data.copy()
-                        result['name'] = municipality_name
-                        result['category'] = category_name.rstrip('s')  # Remove 's' from 'cities'/'counties'
-                        result['distance_km'] = distance
-                        closest_municipality = result
+        idx, distance = _nearest_haversine(
+            self._lat_rad[start:end], self._lon_rad[start:end], self._cos_lat[start:end], lat, lon
+        )
+        idx += start
+        
+        # Consider within 50km as potential match
+        if distance >= MATCH_RADIUS_KM:
+            return None
         
-        return closest_municipality
+        return ChainMap({
+            'name': self._names[idx],
+            'category': self._categories[idx],
+            'distance_km': distance
+        }, self._refs[idx])
     
-    def _find_by_legal_description(self, legal_desc: Dict) -> Optional[Dict]:
+    def _find_by_legal_description(self, legal_desc: Dict) -> Optional[ChainMap]:
         """Find municipality by legal description"""
         # This would typically involve more sophisticated mapping
         # For now, we'll use basic heuristics based on township/range
         
         components = legal_desc.get('components', {})
         
-        if legal_desc.get('type') in ['quarter_section', 'section']:
+        if legal_desc.get('type') in LEGAL_SECTION_TYPES:
             township = components.get('township')
             range_num = components.get('range')
             
@@ -310,64 +429,43 @@ class MunicipalityLookup:
                 try:
                     township_int = int(township)
                     range_int = int(range_num)
-                    
-                    # Basic mapping based on township/range (simplified)
-                    if 40 <= township_int <= 50 and 20 <= range_int <= 30:
-                        return self._find_by_name("Red Deer")
-                    elif 50 <= township_int <= 60 and 20 <= range_int <= 30:
-                        return self._find_by_name("Edmonton")
-                    elif 60 <= township_int <= 70 and 20 <= range_int <= 30:
-                        return self._find_by_name("Athabasca")
-                    
                 except ValueError:
-                    pass
+                    return None
+                
+                # Basic mapping based on township/range (simplified)
+                min_range, max_range = LEGAL_RANGE_LIMITS
+                if min_range <= range_int <= max_range:
+                    match = self._township_index.get(township_int)
+                    if match:
+                        return self._materialize(match)
         
         return None
     
-    def _find_by_address_components(self, address: Dict) -> Optional[Dict]:
+    def _find_by_address_components(self, address: Dict) -> Optional[ChainMap]:
         """Find municipality by address components"""
-        # Extract potential municipality names from address
-        full_address = address.get('full_address', '')
-        
-        # Try to find municipality names in the address
-        for hint in self._extract_location_hints(full_address):
-            municipality = self._find_by_name(hint)
-            if municipality:
-                return municipality
-        
-        return None
+        # Find the first municipality name mentioned in the address
+        match = self._name_pattern.search(address.get('full_address', ''))
+        return self._materialize(self._name_exact[match.group(0).lower()]) if match else None
     
-    def _extract_location_hints(self, text: str) -> List[str]:
-        """Extract potential location names from text"""
-        # This is a simplified version - in practice, you'd use more sophisticated NLP
-        words = text.split()
-        hints = []
-        
-        # Look for capitalized words that might be place names
-        for i, word in enumerate(words):
-            if word[0].isupper() and len(word) > 3:
-                hints.append(word)
-                
-                # Also check two-word combinations
-                if i < len(words) - 1 and words[i + 1][0].isupper():
-                    hints.append(f"{word} {words[i + 1]}")
-        
-        return hints
-    
-    def get_supported_municipalities(self) -> List[Dict]:
-        """Get list of all supported municipalities"""
+    def _build_supported_municipalities(self) -> Tuple[Mapping, ...]:
+        """Build the sorted list of supported municipalities"""
         municipalities = []
         
         for category_name, category_data in self.municipalities_data.items():
             for municipality_name, municipality_data in category_data.items():
-                municipality = municipality_data.copy()
+                municipality = dict(municipality_data)
                 municipality['name'] = municipality_name
                 municipality['category'] = category_name.rstrip('s')
                 municipalities.append(municipality)
         
-        return sorted(municipalities, key=lambda x: x['name'])
+        # Every caller shares these entries, so hand them out read-only
+        return tuple(MappingProxyType(municipality) for municipality in sorted(municipalities, key=lambda x: x['name']))
+    
+    def get_supported_municipalities(self) -> Tuple[Mapping, ...]:
+        """Get list of all supported municipalities"""
+        return self._supported_municipalities
     
-    def get_municipality_details(self, municipality_name: str) -> Optional[Dict]:
+    def get_municipality_details(self, municipality_name: str) -> Optional[ChainMap]:
         """Get detailed information about a specific municipality"""
         municipality = self._find_by_name(municipality_name)
         if municipality:
@@ -1,57 +1,190 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+import threading
 import time
+from types import MappingProxyType
+from cachetools import TTLCache
+
+# Shared HTTP session so pooled connections and TLS state are reused across
+# requests and PolicyRetrieval instances
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Alberta Land Use Tool/1.0 (Land Development Research)'
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
+# Policy results are kept for a day at most, and for at most this many properties.
+# The cache stays in memory: results are built from the tables in this module
+# without network access, so rebuilding them after a restart is cheaper than
+# reading them back from disk. If bylaw pages are ever fetched through _SESSION,
+# cache those HTTP responses on disk rather than these results.
+POLICY_CACHE_SIZE = 1024
+POLICY_CACHE_TTL = 24 * 3600
+
+# Common zoning categories and their typical uses
+ZONING_CATEGORIES = MappingProxyType({category: MappingProxyType(codes) for category, codes in {
+    'residential': {
+        'R1': 'Single Family Residential',
+        'R2': 'Two Family Residential', 
+        'R3': 'Multi-Family Residential',
+        'R4': 'Apartment Residential',
+        'RM': 'Residential Mixed',
+        'MH': 'Mobile Home'
+    },
+    'commercial': {
+        'C1': 'Neighborhood Commercial',
+        'C2': 'Community Commercial',
+        'C3': 'Highway Commercial',
+        'C4': 'Downtown Commercial',
+        'CM': 'Commercial Mixed'
+    },
+    'industrial': {
+        'I1': 'Light Industrial',
+        'I2': 'General Industrial',
+        'I3': 'Heavy Industrial'
+    },
+    'rural': {
+        'AG': 'Agricultural',
+        'RUR': 'Rural Residential',
+        'RC': 'Rural Commercial',
+        'CR': 'Country Residential'
+    },
+    'special': {
+        'P': 'Public/Institutional',
+        'OS': 'Open Space',
+        'PUD': 'Planned Unit Development',
+        'DC': 'Direct Control'
+    }
+}.items()})
+
+# Zoning label and uses for each code _get_zoning_information can assign
+ZONING_TEMPLATES = MappingProxyType({
+    'RC': MappingProxyType({
+        'zoning': 'RC - Rural Commercial',
+        'permitted_uses': (
+            'Tourist accommodation',
+            'Recreation facilities',
+            'Small scale retail',
+            'Restaurants',
+            'Bed and breakfast'
+        ),
+        'discretionary_uses': (
+            'Cottage development',
+            'RV parks',
+            'Event facilities',
+            'Conference centers'
+        )
+    }),
+    'C2': MappingProxyType({
+        'zoning': 'C2 - Community Commercial',
+        'permitted_uses': (
+            'Retail stores',
+            'Restaurants',
+            'Offices',
+            'Personal services'
+        )
+    }),
+    'RUR': MappingProxyType({
+        'zoning': 'RUR - Rural Residential',
+        'permitted_uses': (
+            'Single family dwelling',
+            'Home occupation',
+            'Agriculture (limited)',
+            'Accessory buildings'
+        ),
+        'discretionary_uses': (
+            'Bed and breakfast',
+            'Secondary suite',
+            'Small scale tourism'
+        )
+    }),
+    'R1': MappingProxyType({
+        'zoning': 'R1 - Single Family Residential',
+        'permitted_uses': (
+            'Single family dwelling',
+            'Home occupation',
+            'Accessory buildings'
+        )
+    })
+})
+
+# Setbacks, density and height restrictions by zoning code. Keys match the
+# codes _get_zoning_information assigns; anything else falls back to DEFAULT.
+ZONE_PROFILES = {
+    'R1': {
+        'setbacks': {'front': '7.5 meters', 'rear': '7.5 meters', 'side': '1.5 meters'},
+        'density_restrictions': {
+            'maximum_site_coverage': '35%',
+            'minimum_lot_size': '600 square meters',
+            'maximum_dwelling_units': '1 per lot'
+        },
+        'height_restrictions': {'maximum_height': '9 meters', 'maximum_stories': '2.5'}
+    },
+    'RC': {
+        'setbacks': {'front': '15 meters', 'rear': '15 meters', 'side': '7.5 meters'},
+        'density_restrictions': {
+            'maximum_site_coverage': '40%',
+            'maximum_floor_area_ratio': '0.5',
+            'minimum_lot_size': '2 hectares'
+        },
+        'height_restrictions': {'maximum_height': '12 meters', 'maximum_stories': '3'}
+    },
+    'RUR': {
+        'setbacks': {'front': '30 meters', 'rear': '15 meters', 'side': '15 meters'},
+        'density_restrictions': {
+            'maximum_site_coverage': '25%',
+            'minimum_lot_size': '2 hectares',
+            'maximum_dwelling_units': '1 per lot'
+        },
+        'height_restrictions': {'maximum_height': '10 meters', 'maximum_stories': '2.5'}
+    },
+    'C2': {
+        'setbacks': {'front': '6 meters', 'rear': '6 meters', 'side': '3 meters'},
+        'density_restrictions': {},
+        'height_restrictions': {'maximum_height': '12 meters', 'maximum_stories': '3'}
+    },
+    'DEFAULT': {
+        'setbacks': {'front': '6 meters', 'rear': '6 meters', 'side': '3 meters'},
+        'density_restrictions': {},
+        'height_restrictions': {'maximum_height': '9 meters', 'maximum_stories': '2.5'}
+    }
+}
+
+
+def _extract_zone_code(zoning: str) -> str:
+    """Get the leading zoning code from a label such as 'RC - Rural Commercial'"""
+    return zoning.split(' ', 1)[0] if zoning else ''
+
+
+def _policy_cache_key(municipality_name: str, property_info: Dict) -> Tuple:
+    """Build a cache key from the property inputs that policy results depend on"""
+    # Only acreage and zoning hints affect the result, so other details such as
+    # the address or coordinates don't need to be part of the key
+    property_details = property_info.get('property_details', {})
+    return (
+        municipality_name,
+        property_details.get('acreage', 0),
+        tuple(property_details.get('zoning_hints', ()))
+    )
 
 class PolicyRetrieval:
     """Retrieve land use policies and zoning information for Alberta municipalities"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Alberta Land Use Tool/1.0 (Land Development Research)'
-        })
+        self.session = _SESSION
         
         # Cache for policy data to avoid repeated requests
-        self.policy_cache = {}
+        self.policy_cache = TTLCache(maxsize=POLICY_CACHE_SIZE, ttl=POLICY_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+        # Cache keys currently being built, each with an event set when it's done
+        self._inflight: Dict[Tuple, threading.Event] = {}
         
         # Common zoning categories and their typical uses
-        self.zoning_categories = {
-            'residential': {
-                'R1': 'Single Family Residential',
-                'R2': 'Two Family Residential', 
-                'R3': 'Multi-Family Residential',
-                'R4': 'Apartment Residential',
-                'RM': 'Residential Mixed',
-                'MH': 'Mobile Home'
-            },
-            'commercial': {
-                'C1': 'Neighborhood Commercial',
-                'C2': 'Community Commercial',
-                'C3': 'Highway Commercial',
-                'C4': 'Downtown Commercial',
-                'CM': 'Commercial Mixed'
-            },
-            'industrial': {
-                'I1': 'Light Industrial',
-                'I2': 'General Industrial',
-                'I3': 'Heavy Industrial'
-            },
-            'rural': {
-                'AG': 'Agricultural',
-                'RUR': 'Rural Residential',
-                'RC': 'Rural Commercial',
-                'CR': 'Country Residential'
-            },
-            'special': {
-                'P': 'Public/Institutional',
-                'OS': 'Open Space',
-                'PUD': 'Planned Unit Development',
-                'DC': 'Direct Control'
-            }
-        }
+        self.zoning_categories = ZONING_CATEGORIES
     
     def get_land_use_policies(self, municipality_info: Dict, property_info: Dict) -> Dict:
         """
@@ -65,12 +198,38 @@ class PolicyRetrieval:
             Dictionary containing policy and zoning information
         """
         municipality_name = municipality_info.get('name', '')
-        cache_key = f"{municipality_name}_{hash(str(property_info))}"
+        cache_key = _policy_cache_key(municipality_name, property_info)
+        
+        # Check cache first; if another thread is already building this entry,
+        # wait for it instead of repeating the work
+        with self._cache_lock:
+            cached = self.policy_cache.get(cache_key)
+            pending = None if cached is not None else self._inflight.get(cache_key)
+            if cached is None and pending is None:
+                self._inflight[cache_key] = threading.Event()
+        if cached is not None:
+            return cached
+        if pending is not None:
+            pending.wait()
+            with self._cache_lock:
+                cached = self.policy_cache.get(cache_key)
+            # The other build failed, so fall back to building without coalescing
+            return cached if cached is not None else self._build_policy_info(municipality_info, property_info)
         
-        # Check cache first
-        if cache_key in self.policy_cache:
-            return self.policy_cache[cache_key]
+        try:
+            policy_info = self._build_policy_info(municipality_info, property_info)
+            if 'error' not in policy_info:
+                with self._cache_lock:
+                    self.policy_cache[cache_key] = policy_info
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(cache_key).set()
         
+        return policy_info
+    
+    def _build_policy_info(self, municipality_info: Dict, property_info: Dict) -> Dict:
+        """Assemble policy information without consulting the cache"""
+        municipality_name = municipality_info.get('name', '')
         policy_info = {
             'municipality': municipality_name,
             'zoning': None,
@@ -87,6 +246,10 @@ class PolicyRetrieval:
             'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
+        # These steps run in order: development requirements depend on the zoning
+        # result, and none of them make network requests yet. Once zoning and bylaw
+        # data come from municipal endpoints, those two fetches are independent and
+        # can be issued concurrently.
         try:
             # Get zoning information
             zoning_info = self._get_zoning_information(municipality_info, property_info)
@@ -103,14 +266,22 @@ class PolicyRetrieval:
             if dev_requirements:
                 policy_info['development_requirements'] = dev_requirements
             
-            # Cache the results
-            self.policy_cache[cache_key] = policy_info
-            
         except Exception as e:
             policy_info['error'] = f"Error retrieving policy information: {str(e)}"
         
         return policy_info
     
+    def invalidate(self, municipality_name: str):
+        """Drop cached policy information for a municipality"""
+        with self._cache_lock:
+            for cache_key in [key for key in self.policy_cache if key[0] == municipality_name]:
+                self.policy_cache.pop(cache_key, None)
+    
+    def clear(self):
+        """Drop all cached policy information"""
+        with self._cache_lock:
+            self.policy_cache.clear()
+    
     def _get_zoning_information(self, municipality_info: Dict, property_info: Dict) -> Optional[Dict]:
         """Get zoning information for the property"""
         municipality_name = municipality_info.get('name', '')
@@ -118,8 +289,6 @@ class PolicyRetrieval:
         # For demonstration, we'll use mock data based on property characteristics
         # In a real implementation, this would query municipal zoning databases or APIs
         
-        zoning_info = {}
-        
         # Determine likely zoning based on property details
         property_details = property_info.get('property_details', {})
         acreage = property_details.get('acreage', 0)
@@ -127,54 +296,19 @@ class PolicyRetrieval:
         
         # Mock zoning determination logic
         if 'commercial' in zoning_hints:
-            if acreage > 5:
-                zoning_info['zoning'] = 'RC - Rural Commercial'
-                zoning_info['permitted_uses'] = [
-                    'Tourist accommodation',
-                    'Recreation facilities',
-                    'Small scale retail',
-                    'Restaurants',
-                    'Bed and breakfast'
-                ]
-                zoning_info['discretionary_uses'] = [
-                    'Cottage development',
-                    'RV parks',
-                    'Event facilities',
-                    'Conference centers'
-                ]
-            else:
-                zoning_info['zoning'] = 'C2 - Community Commercial'
-                zoning_info['permitted_uses'] = [
-                    'Retail stores',
-                    'Restaurants',
-                    'Offices',
-                    'Personal services'
-                ]
+            zone_code = 'RC' if acreage > 5 else 'C2'
         elif 'rural' in zoning_hints or acreage > 2:
-            zoning_info['zoning'] = 'RUR - Rural Residential'
-            zoning_info['permitted_uses'] = [
-                'Single family dwelling',
-                'Home occupation',
-                'Agriculture (limited)',
-                'Accessory buildings'
-            ]
-            zoning_info['discretionary_uses'] = [
-                'Bed and breakfast',
-                'Secondary suite',
-                'Small scale tourism'
-            ]
+            zone_code = 'RUR'
         else:
-            zoning_info['zoning'] = 'R1 - Single Family Residential'
-            zoning_info['permitted_uses'] = [
-                'Single family dwelling',
-                'Home occupation',
-                'Accessory buildings'
-            ]
+            zone_code = 'R1'
+        
+        zoning_info = {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in ZONING_TEMPLATES[zone_code].items()
+        }
         
         # Add typical setbacks and restrictions
-        zoning_info['setbacks'] = self._get_typical_setbacks(zoning_info.get('zoning', ''))
-        zoning_info['density_restrictions'] = self._get_density_restrictions(zoning_info.get('zoning', ''))
-        zoning_info['height_restrictions'] = self._get_height_restrictions(zoning_info.get('zoning', ''))
+        zoning_info.update(self._get_zone_profile(zoning_info.get('zoning', '')))
         
         return zoning_info
     
@@ -192,7 +326,8 @@ class PolicyRetrieval:
         }
         
         try:
-            # In a real implementation, this would scrape or access the actual bylaw
+            # In a real implementation, this would scrape or access the actual bylaw;
+            # parse fetched pages with lxml.html rather than BeautifulSoup's html.parser
             # For now, we'll provide typical bylaw structure
             bylaw_info['sections'] = [
                 {
@@ -234,8 +369,9 @@ class PolicyRetrieval:
             'Building permit required',
             'Compliance with Alberta Building Code'
         ]
+        zoning_folded = zoning.casefold() if zoning else ''
         
-        if zoning and 'commercial' in zoning.lower():
+        if 'commercial' in zoning_folded:
             requirements.extend([
                 'Site plan approval required',
                 'Parking plan submission',
@@ -243,7 +379,7 @@ class PolicyRetrieval:
                 'Signage approval needed'
             ])
         
-        if zoning and 'rural' in zoning.lower():
+        if 'rural' in zoning_folded:
             requirements.extend([
                 'Septic system approval (if applicable)',
                 'Water well testing (if applicable)',
@@ -262,83 +398,12 @@ class PolicyRetrieval:
         
         return requirements
     
-    def _get_typical_setbacks(self, zoning: str) -> Dict:
-        """Get typical setback requirements for zoning"""
-        setbacks = {}
-        
-        if 'R1' in zoning or 'Single Family' in zoning:
-            setbacks = {
-                'front': '7.5 meters',
-                'rear': '7.5 meters',
-                'side': '1.5 meters'
-            }
-        elif 'RC' in zoning or 'Rural Commercial' in zoning:
-            setbacks = {
-                'front': '15 meters',
-                'rear': '15 meters',
-                'side': '7.5 meters'
-            }
-        elif 'RUR' in zoning or 'Rural' in zoning:
-            setbacks = {
-                'front': '30 meters',
-                'rear': '15 meters',
-                'side': '15 meters'
-            }
-        else:
-            setbacks = {
-                'front': '6 meters',
-                'rear': '6 meters',
-                'side': '3 meters'
-            }
-        
-        return setbacks
-    
-    def _get_density_restrictions(self, zoning: str) -> Dict:
-        """Get density restrictions for zoning"""
-        density = {}
-        
-        if 'RC' in zoning or 'Rural Commercial' in zoning:
-            density = {
-                'maximum_site_coverage': '40%',
-                'maximum_floor_area_ratio': '0.5',
-                'minimum_lot_size': '2 hectares'
-            }
-        elif 'RUR' in zoning or 'Rural' in zoning:
-            density = {
-                'maximum_site_coverage': '25%',
-                'minimum_lot_size': '2 hectares',
-                'maximum_dwelling_units': '1 per lot'
-            }
-        elif 'R1' in zoning:
-            density = {
-                'maximum_site_coverage': '35%',
-                'minimum_lot_size': '600 square meters',
-                'maximum_dwelling_units': '1 per lot'
-            }
-        
-        return density
-    
-    def _get_height_restrictions(self, zoning: str) -> Dict:
-        """Get height restrictions for zoning"""
-        height = {}
-        
-        if 'RC' in zoning or 'Commercial' in zoning:
-            height = {
-                'maximum_height': '12 meters',
-                'maximum_stories': '3'
-            }
-        elif 'RUR' in zoning or 'Rural' in zoning:
-            height = {
-                'maximum_height': '10 meters',
-                'maximum_stories': '2.5'
-            }
-        else:
-            height = {
-                'maximum_height': '9 meters',
-                'maximum_stories': '2.5'
-            }
+    def _get_zone_profile(self, zoning: str) -> Dict:
+        """Get setbacks, density and height restrictions for zoning in one lookup"""
+        profile = ZONE_PROFILES.get(_extract_zone_code(zoning), ZONE_PROFILES['DEFAULT'])
         
-        return height
+        # Hand out copies so callers can't alter the shared table
+        return {key: dict(value) for key, value in profile.items()}
     
     def get_cottage_development_analysis(self, policy_info: Dict, property_details: Dict) -> Dict:
         """
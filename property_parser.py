@@ -1,28 +1,105 @@
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Dict, Optional, List
+from geopy.adapters import RequestsAdapter
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
+
+# Shared geocoder; its pooled adapter keeps connections to Nominatim alive
+# across calls and PropertyParser instances, and retries transient failures
+_GEOLOCATOR = Nominatim(
+    user_agent="alberta_land_use_tool",
+    adapter_factory=partial(
+        RequestsAdapter,
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+)
+
+# Geocoding runs here while the rest of the input is parsed on the calling thread
+_GEOCODE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='geocode')
+
+# Minimum spacing in seconds between batched Nominatim requests
+NOMINATIM_MIN_DELAY = 1.0
+
+# Geocoded addresses are remembered for a week, up to this many addresses
+GEOCODE_CACHE_SIZE = 4096
+GEOCODE_CACHE_TTL = 7 * 24 * 3600
+
+# Common Alberta municipalities between Red Deer and Athabasca
+MUNICIPALITY_NAMES = (
+    'Red Deer', 'Lacombe', 'Ponoka', 'Wetaskiwin', 'Camrose', 'Leduc',
+    'Edmonton', 'St. Albert', 'Sherwood Park', 'Fort Saskatchewan',
+    'Morinville', 'Legal', 'Bon Accord', 'Gibbons', 'Redwater',
+    'Smoky Lake', 'Vilna', 'Mundare', 'Lamont', 'Bruderheim',
+    'Athabasca', 'Boyle', 'Westlock', 'Barrhead', 'Mayerthorpe',
+    'Whitecourt', 'Slave Lake', 'High Prairie', 'Valleyview'
+)
+
+# Also include county names
+COUNTY_NAMES = (
+    'Lacombe County', 'Ponoka County', 'Wetaskiwin County',
+    'Camrose County', 'Leduc County', 'Strathcona County',
+    'Sturgeon County', 'Parkland County', 'Lac Ste. Anne County',
+    'Barrhead County', 'Westlock County', 'Athabasca County'
+)
+
+# Casefolded name -> display name, plus one alternation that finds any of them in
+# a single pass; longer names go first so "Lacombe County" is matched whole
+_LOCATION_NAMES = {name.casefold(): name for name in MUNICIPALITY_NAMES + COUNTY_NAMES}
+_LOCATION_PATTERN = re.compile(
+    '|'.join(re.escape(name) for name in sorted(_LOCATION_NAMES, key=len, reverse=True))
+)
+
+# Keywords looked for in additional property information, by detail category
+PROPERTY_KEYWORDS = {
+    'zoning_hints': ('commercial', 'residential', 'rural', 'agricultural', 'industrial'),
+    'development_intentions': ('develop', 'cottages', 'subdivision', 'building', 'construction'),
+    'infrastructure_mentions': ('septic', 'water', 'power', 'sewer', 'gas', 'internet')
+}
+_KEYWORD_PATTERN = re.compile(
+    '|'.join(re.escape(keyword) for keywords in PROPERTY_KEYWORDS.values() for keyword in keywords)
+)
+# Both scans are literal alternations that the stdlib engine handles without
+# backtracking blowups; RE2 bindings measured slower here due to per-match overhead
+_ACREAGE_PATTERN = re.compile(r'(\d+\.?\d*)\s*acres?', re.IGNORECASE)
+
+# Legal description patterns for Alberta
+LEGAL_PATTERNS = {
+    'quarter_section': re.compile(r'([NSEW]{1,2})\s*(\d{1,2})\s*-\s*(\d{1,3})\s*-\s*(\d{1,3})\s*-\s*([WE])\s*(\d)', re.IGNORECASE),
+    'lot_block': re.compile(r'LOT\s*(\d+)\s*,?\s*BLOCK\s*(\d+)\s*,?\s*PLAN\s*(\w+)', re.IGNORECASE),
+    'parcel': re.compile(r'PARCEL\s*(\w+)\s*,?\s*PLAN\s*(\w+)', re.IGNORECASE),
+    'section': re.compile(r'SECTION\s*(\d{1,2})\s*,?\s*TOWNSHIP\s*(\d{1,3})\s*,?\s*RANGE\s*(\d{1,3})\s*,?\s*([WE])\s*(\d)', re.IGNORECASE)
+}
+
+# Address patterns
+ADDRESS_PATTERNS = {
+    'street_address': re.compile(r'(\d+)\s+([A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Circle|Cir|Court|Ct|Crescent|Cres))', re.IGNORECASE),
+    'rural_address': re.compile(r'(RR|Rural Route|Range Road|Township Road|Highway|Hwy)\s*(\d+)', re.IGNORECASE),
+    'postal_code': re.compile(r'([A-Za-z]\d[A-Za-z]\s*\d[A-Za-z]\d)', re.IGNORECASE)
+}
+
+def _normalize_address(address: str) -> str:
+    """Collapse case and whitespace differences so equivalent addresses share a cache entry"""
+    return ' '.join(address.split()).casefold()
 
 class PropertyParser:
     """Parse property information from various input formats"""
     
     def __init__(self):
-        self.geolocator = Nominatim(user_agent="alberta_land_use_tool")
-        
-        # Legal description patterns for Alberta
-        self.legal_patterns = {
-            'quarter_section': re.compile(r'([NSEW]{1,2})\s*(\d{1,2})\s*-\s*(\d{1,3})\s*-\s*(\d{1,3})\s*-\s*([WE])\s*(\d)', re.IGNORECASE),
-            'lot_block': re.compile(r'LOT\s*(\d+)\s*,?\s*BLOCK\s*(\d+)\s*,?\s*PLAN\s*(\w+)', re.IGNORECASE),
-            'parcel': re.compile(r'PARCEL\s*(\w+)\s*,?\s*PLAN\s*(\w+)', re.IGNORECASE),
-            'section': re.compile(r'SECTION\s*(\d{1,2})\s*,?\s*TOWNSHIP\s*(\d{1,3})\s*,?\s*RANGE\s*(\d{1,3})\s*,?\s*([WE])\s*(\d)', re.IGNORECASE)
-        }
+        self.geolocator = _GEOLOCATOR
+        self.geocode_cache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+        self._geocode_lock = threading.Lock()
         
-        # Address patterns
-        self.address_patterns = {
-            'street_address': re.compile(r'(\d+)\s+([A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Circle|Cir|Court|Ct|Crescent|Cres))', re.IGNORECASE),
-            'rural_address': re.compile(r'(RR|Rural Route|Range Road|Township Road|Highway|Hwy)\s*(\d+)', re.IGNORECASE),
-            'postal_code': re.compile(r'([A-Za-z]\d[A-Za-z]\s*\d[A-Za-z]\d)', re.IGNORECASE)
-        }
+        # Patterns are compiled once at import; kept as attributes for existing callers
+        self.legal_patterns = LEGAL_PATTERNS
+        self.address_patterns = ADDRESS_PATTERNS
     
     def parse_property_info(self, address: str = "", legal_description: str = "", additional_info: str = "") -> Optional[Dict]:
         """
@@ -36,6 +113,56 @@ class PropertyParser:
         Returns:
             Dictionary containing parsed property information
         """
+        # Nothing can identify the property without any input
+        if not (address or legal_description or additional_info):
+            return None
+        
+        # Start geocoding first so the network round trip overlaps local parsing
+        geocode_future = _GEOCODE_EXECUTOR.submit(self._geocode_address, address) if address else None
+        
+        property_info = self._parse_inputs(address, legal_description, additional_info)
+        
+        # Collect the geocoding result
+        if geocode_future is not None:
+            property_info['coordinates'] = geocode_future.result()
+        
+        return property_info
+    
+    def parse_many(self, properties: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Parse several properties, geocoding their addresses as one batch
+        
+        Args:
+            properties: Dictionaries with optional 'address', 'legal_description'
+                and 'additional_info' entries
+            
+        Returns:
+            Parsed property information for each property in input order, or None
+            where a property has no input
+        """
+        addresses = [item.get('address', '') for item in properties]
+        
+        # Geocode every distinct address up front at Nominatim's permitted rate
+        to_geocode = [address for address in addresses if address]
+        coordinates_by_address = dict(zip(to_geocode, self.geocode_many(to_geocode)))
+        
+        results = []
+        for item, address in zip(properties, addresses):
+            legal_description = item.get('legal_description', '')
+            additional_info = item.get('additional_info', '')
+            
+            if not (address or legal_description or additional_info):
+                results.append(None)
+                continue
+            
+            property_info = self._parse_inputs(address, legal_description, additional_info)
+            property_info['coordinates'] = coordinates_by_address.get(address)
+            results.append(property_info)
+        
+        return results
+    
+    def _parse_inputs(self, address: str, legal_description: str, additional_info: str) -> Dict:
+        """Parse everything except coordinates from the raw inputs"""
         property_info = {
             'raw_input': {
                 'address': address,
@@ -52,11 +179,6 @@ class PropertyParser:
         # Parse address
         if address:
             property_info['parsed_address'] = self._parse_address(address)
-            
-            # Try to geocode the address
-            coordinates = self._geocode_address(address)
-            if coordinates:
-                property_info['coordinates'] = coordinates
         
         # Parse legal description
         if legal_description:
@@ -70,7 +192,7 @@ class PropertyParser:
         if additional_info:
             property_info['property_details'] = self._extract_property_details(additional_info)
         
-        return property_info if self._is_valid_property_info(property_info) else None
+        return property_info
     
     def _parse_address(self, address: str) -> Dict:
         """Parse street or rural address"""
@@ -80,26 +202,27 @@ class PropertyParser:
             'full_address': address.strip()
         }
         
-        # Check for street address
-        street_match = self.address_patterns['street_address'].search(address)
-        if street_match:
-            parsed['type'] = 'street'
-            parsed['components'] = {
-                'number': street_match.group(1),
-                'street': street_match.group(2).strip()
-            }
-        
-        # Check for rural address
-        rural_match = self.address_patterns['rural_address'].search(address)
+        # Check for rural address first; when one is present it takes precedence,
+        # so the costlier street pattern only runs for non-rural addresses
+        rural_match = ADDRESS_PATTERNS['rural_address'].search(address)
         if rural_match:
             parsed['type'] = 'rural'
             parsed['components'] = {
                 'road_type': rural_match.group(1),
                 'road_number': rural_match.group(2)
             }
+        else:
+            # Check for street address
+            street_match = ADDRESS_PATTERNS['street_address'].search(address)
+            if street_match:
+                parsed['type'] = 'street'
+                parsed['components'] = {
+                    'number': street_match.group(1),
+                    'street': street_match.group(2).strip()
+                }
         
         # Extract postal code
-        postal_match = self.address_patterns['postal_code'].search(address)
+        postal_match = ADDRESS_PATTERNS['postal_code'].search(address)
         if postal_match:
             parsed['components']['postal_code'] = postal_match.group(1).upper().replace(' ', '')
         
@@ -114,7 +237,7 @@ class PropertyParser:
         }
         
         # Try different legal description patterns
-        for pattern_name, pattern in self.legal_patterns.items():
+        for pattern_name, pattern in LEGAL_PATTERNS.items():
             match = pattern.search(legal_desc)
             if match:
                 parsed['type'] = pattern_name
@@ -153,99 +276,86 @@ class PropertyParser:
     
     def _geocode_address(self, address: str) -> Optional[Dict]:
         """Geocode address to get coordinates"""
+        cache_key = _normalize_address(address)
+        
+        # Check cache first
+        with self._geocode_lock:
+            cached = self.geocode_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Add Alberta, Canada to improve geocoding accuracy
             full_address = f"{address}, Alberta, Canada"
             location = self.geolocator.geocode(full_address, timeout=10)
             
             if location:
-                return {
+                coordinates = {
                     'latitude': location.latitude,
                     'longitude': location.longitude,
                     'display_name': location.address
                 }
+                # Only successful lookups are cached so timeouts are retried
+                with self._geocode_lock:
+                    self.geocode_cache[cache_key] = coordinates
+                return coordinates
         except (GeocoderTimedOut, GeocoderServiceError):
             pass
         
         return None
     
+    def geocode_many(self, addresses: List[str]) -> List[Optional[Dict]]:
+        """
+        Geocode several addresses, querying each distinct address only once
+        
+        Args:
+            addresses: Street addresses to geocode
+            
+        Returns:
+            Coordinates for each address in input order, or None where not found
+        """
+        results = {}
+        last_request = None
+        
+        for address in dict.fromkeys(addresses):
+            with self._geocode_lock:
+                cached = self.geocode_cache.get(_normalize_address(address))
+            if cached is not None:
+                results[address] = cached
+                continue
+            
+            # Nominatim's usage policy allows one request per second
+            if last_request is not None:
+                wait = NOMINATIM_MIN_DELAY - (time.monotonic() - last_request)
+                if wait > 0:
+                    time.sleep(wait)
+            last_request = time.monotonic()
+            results[address] = self._geocode_address(address)
+        
+        return [results[address] for address in addresses]
+    
     def _extract_municipality_hints(self, text: str) -> List[str]:
         """Extract potential municipality names from text"""
-        # Common Alberta municipalities between Red Deer and Athabasca
-        municipalities = [
-            'Red Deer', 'Lacombe', 'Ponoka', 'Wetaskiwin', 'Camrose', 'Leduc',
-            'Edmonton', 'St. Albert', 'Sherwood Park', 'Fort Saskatchewan',
-            'Morinville', 'Legal', 'Bon Accord', 'Gibbons', 'Redwater',
-            'Smoky Lake', 'Vilna', 'Mundare', 'Lamont', 'Bruderheim',
-            'Athabasca', 'Boyle', 'Westlock', 'Barrhead', 'Mayerthorpe',
-            'Whitecourt', 'Slave Lake', 'High Prairie', 'Valleyview'
-        ]
-        
-        # Also include county names
-        counties = [
-            'Lacombe County', 'Ponoka County', 'Wetaskiwin County',
-            'Camrose County', 'Leduc County', 'Strathcona County',
-            'Sturgeon County', 'Parkland County', 'Lac Ste. Anne County',
-            'Barrhead County', 'Westlock County', 'Athabasca County'
-        ]
-        
-        all_locations = municipalities + counties
-        found_hints = []
-        
-        text_lower = text.lower()
-        for location in all_locations:
-            if location.lower() in text_lower:
-                found_hints.append(location)
-        
-        return found_hints
+        # Repeat mentions are dropped, keeping the order names first appear in
+        return list(dict.fromkeys(
+            _LOCATION_NAMES[match.group(0)]
+            for match in _LOCATION_PATTERN.finditer(text.casefold())
+        ))
     
     def _extract_property_details(self, additional_info: str) -> Dict:
         """Extract property details from additional information"""
         details = {}
         
         # Extract acreage
-        acreage_match = re.search(r'(\d+\.?\d*)\s*acres?', additional_info, re.IGNORECASE)
+        acreage_match = _ACREAGE_PATTERN.search(additional_info)
         if acreage_match:
             details['acreage'] = float(acreage_match.group(1))
         
-        # Extract zoning hints
-        zoning_keywords = ['commercial', 'residential', 'rural', 'agricultural', 'industrial']
-        for keyword in zoning_keywords:
-            if keyword in additional_info.lower():
-                details.setdefault('zoning_hints', []).append(keyword)
-        
-        # Extract development intentions
-        development_keywords = ['develop', 'cottages', 'subdivision', 'building', 'construction']
-        for keyword in development_keywords:
-            if keyword in additional_info.lower():
-                details.setdefault('development_intentions', []).append(keyword)
-        
-        # Extract infrastructure mentions
-        infrastructure_keywords = ['septic', 'water', 'power', 'sewer', 'gas', 'internet']
-        for keyword in infrastructure_keywords:
-            if keyword in additional_info.lower():
-                details.setdefault('infrastructure_mentions', []).append(keyword)
+        # Extract zoning hints, development intentions and infrastructure mentions
+        found_keywords = {match.group(0) for match in _KEYWORD_PATTERN.finditer(additional_info.casefold())}
+        for category, keywords in PROPERTY_KEYWORDS.items():
+            matches = [keyword for keyword in keywords if keyword in found_keywords]
+            if matches:
+                details[category] = matches
         
         return details
-    
-    def _is_valid_property_info(self, property_info: Dict) -> bool:
-        """Check if parsed property information is valid"""
-        # Must have either a valid address or legal description
-        has_address = (property_info.get('parsed_address') and 
-                      property_info['parsed_address']['type'] != 'unknown')
-        
-        has_legal = (property_info.get('parsed_legal') and 
-                    property_info['parsed_legal']['type'] != 'unknown')
-        
-        has_coordinates = property_info.get('coordinates') is not None
-        
-        has_municipality_hints = len(property_info.get('municipality_hints', [])) > 0
-        
-        has_property_details = len(property_info.get('property_details', {})) > 0
-        
-        has_raw_input = bool(property_info.get('raw_input', {}).get('address') or 
-                           property_info.get('raw_input', {}).get('legal_description') or
-                           property_info.get('raw_input', {}).get('additional_info'))
-        
-        # Valid if we have at least one way to identify the property
-        return has_address or has_legal or has_coordinates or has_municipality_hints or has_property_details or has_raw_input
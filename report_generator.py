@@ -5,64 +5,178 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import os
+from io import BytesIO
+from xml.sax.saxutils import escape
+from copy import copy
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+def _build_styles():
+    """Build the sample stylesheet with the report's custom paragraph styles"""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Title'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='Subtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.darkblue,
+        borderWidth=1,
+        borderColor=colors.darkblue,
+        borderPadding=5
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading3'],
+        fontSize=14,
+        spaceAfter=6,
+        spaceBefore=12,
+        textColor=colors.darkgreen
+    ))
+    
+    # Highlight style
+    styles.add(ParagraphStyle(
+        name='Highlight',
+        parent=styles['Normal'],
+        backColor=colors.lightgrey,
+        borderWidth=1,
+        borderColor=colors.grey,
+        borderPadding=8,
+        spaceAfter=12
+    ))
+    
+    return styles
+
+def _bullet_list(items: List[str], style: ParagraphStyle) -> Paragraph:
+    """Render items as one bulleted paragraph instead of a paragraph per item"""
+    return Paragraph('<br/>'.join(f"• {escape(str(item))}" for item in items), style)
+
+def _numbered_list(items: List[str], style: ParagraphStyle) -> Paragraph:
+    """Render items as one numbered paragraph instead of a paragraph per item"""
+    return Paragraph('<br/>'.join(f"{i}. {escape(str(item))}" for i, item in enumerate(items, 1)), style)
+
+@lru_cache(maxsize=256)
+def _format_label(key: str) -> str:
+    """Turn a data key such as 'minimum_lot_size' into a table label"""
+    return key.replace('_', ' ').title()
+
+def _end_page(story: List):
+    """Start a new page, dropping any spacing left at the end of the current one"""
+    while story and isinstance(story[-1], Spacer):
+        story.pop()
+    story.append(PageBreak())
+
+# How dates are shown in reports
+REPORT_DATE_FORMAT = '%B %d, %Y'
+
+# Styles never change between reports, so they are built once and shared
+_STYLES = _build_styles()
+
+# Text that is the same in every report
+DISCLAIMER_TEXT = """
+    <b>DISCLAIMER:</b> This report is based on publicly available information and automated analysis. 
+    It is intended for preliminary assessment purposes only. All information should be verified with 
+    the appropriate municipal authorities before making any development decisions. This report does 
+    not constitute professional planning or legal advice.
+    """
+
+ADDITIONAL_CONSIDERATIONS = (
+    "Engage a qualified land use planner for detailed analysis",
+    "Conduct environmental due diligence assessments",
+    "Verify all utility capacities and connection costs",
+    "Review neighboring property developments and restrictions",
+    "Consider market analysis for proposed development type",
+    "Evaluate financing options and development timeline"
+)
+
+METHODOLOGY_TEXT = """
+    This feasibility study was conducted using the Alberta Land Use Feasibility Tool, which employs 
+    automated analysis of publicly available municipal data, zoning information, and land use policies. 
+    The analysis includes property identification, municipality lookup, zoning classification, and 
+    policy interpretation based on standard Alberta municipal planning practices.
+    
+    The tool provides preliminary assessments based on available data and should be supplemented 
+    with professional planning consultation and municipal verification for final development decisions.
+    """
+
+# Static paragraphs are parsed once; each report appends a shallow copy so
+# layout state from one build never carries into another
+_DISCLAIMER_PARAGRAPH = Paragraph(DISCLAIMER_TEXT, _STYLES['Highlight'])
+_ADDITIONAL_CONSIDERATIONS_PARAGRAPH = _bullet_list(ADDITIONAL_CONSIDERATIONS, _STYLES['Normal'])
+_METHODOLOGY_PARAGRAPH = Paragraph(METHODOLOGY_TEXT, _STYLES['Normal'])
+
+# Column widths for two-column tables: equal halves, or a narrow label column
+_EVEN_COLUMNS = (3*inch, 3*inch)
+_LABEL_COLUMNS = (2*inch, 4*inch)
+
+# Table styles are identical across reports, so they are built once.
+# Summary: header row in dark blue over beige rows, with a larger header font
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+# Header row in dark blue over beige rows
+_HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+# Label/value rows with bold labels on a light grey column
+_DETAIL_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+# Label/value rows aligned to the top, for values that may wrap
+_PROPERTY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
 
 class ReportGenerator:
     """Generate PDF reports for land use feasibility studies"""
     
+    # Set once the reports directory is known to exist in this process
+    _dir_created = False
+    
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = _STYLES
         
         # Create reports directory if it doesn't exist
         self.reports_dir = "reports"
-        os.makedirs(self.reports_dir, exist_ok=True)
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='Subtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            textColor=colors.darkblue,
-            borderWidth=1,
-            borderColor=colors.darkblue,
-            borderPadding=5
-        ))
-        
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            spaceAfter=6,
-            spaceBefore=12,
-            textColor=colors.darkgreen
-        ))
-        
-        # Highlight style
-        self.styles.add(ParagraphStyle(
-            name='Highlight',
-            parent=self.styles['Normal'],
-            backColor=colors.lightgrey,
-            borderWidth=1,
-            borderColor=colors.grey,
-            borderPadding=8,
-            spaceAfter=12
-        ))
+        if not ReportGenerator._dir_created:
+            os.makedirs(self.reports_dir, exist_ok=True)
+            ReportGenerator._dir_created = True
     
     def create_report(self, analysis_data: Dict) -> str:
         """
@@ -78,9 +192,27 @@ class ReportGenerator:
         filename = f"land_use_feasibility_report_{timestamp}.pdf"
         filepath = os.path.join(self.reports_dir, filename)
         
+        # Write the finished document in one call rather than as it is built
+        with open(filepath, 'wb') as f:
+            f.write(self.create_report_bytes(analysis_data))
+        
+        return filepath
+    
+    def create_report_bytes(self, analysis_data: Dict) -> bytes:
+        """
+        Create a comprehensive PDF report in memory
+        
+        Args:
+            analysis_data: Complete analysis data from the API
+            
+        Returns:
+            Contents of the generated PDF report
+        """
+        buffer = BytesIO()
+        
         # Create the PDF document
         doc = SimpleDocTemplate(
-            filepath,
+            buffer,
             pagesize=A4,
             rightMargin=72,
             leftMargin=72,
@@ -88,43 +220,55 @@ class ReportGenerator:
             bottomMargin=18
         )
         
+        # Date printed on the report, formatted once for every section that shows it
+        report_date = datetime.now().strftime(REPORT_DATE_FORMAT)
+        
+        # Look up each part of the analysis once for all sections
+        property_info = analysis_data.get('property_info') or {}
+        municipality_info = analysis_data.get('municipality_info') or {}
+        policy_info = analysis_data.get('policy_info') or {}
+        feasibility_summary = analysis_data.get('feasibility_summary') or {}
+        
         # Build the story (content)
         story = []
         
         # Title page
-        story.extend(self._create_title_page(analysis_data))
-        story.append(PageBreak())
+        story.extend(self._create_title_page(
+            property_info, municipality_info, analysis_data.get('analysis_date'), report_date
+        ))
+        _end_page(story)
         
         # Executive summary
-        story.extend(self._create_executive_summary(analysis_data))
-        story.append(PageBreak())
+        story.extend(self._create_executive_summary(feasibility_summary, municipality_info, policy_info, report_date))
+        _end_page(story)
         
         # Property information
-        story.extend(self._create_property_section(analysis_data))
+        story.extend(self._create_property_section(property_info))
         
         # Municipality information
-        story.extend(self._create_municipality_section(analysis_data))
+        story.extend(self._create_municipality_section(municipality_info))
         
         # Zoning and policy analysis
-        story.extend(self._create_policy_section(analysis_data))
+        story.extend(self._create_policy_section(policy_info))
         
         # Development analysis (if cottage development data available)
-        if 'cottage_analysis' in analysis_data:
-            story.extend(self._create_development_analysis(analysis_data))
+        if analysis_data.get('cottage_analysis'):
+            story.extend(self._create_development_analysis(analysis_data['cottage_analysis']))
         
         # Recommendations and next steps
-        story.extend(self._create_recommendations_section(analysis_data))
+        story.extend(self._create_recommendations_section(feasibility_summary))
         
         # Appendices
-        story.append(PageBreak())
-        story.extend(self._create_appendices(analysis_data))
+        _end_page(story)
+        story.extend(self._create_appendices(municipality_info))
         
         # Build the PDF
         doc.build(story)
         
-        return filepath
+        return buffer.getvalue()
     
-    def _create_title_page(self, data: Dict) -> List:
+    def _create_title_page(self, property_info: Dict, municipality_info: Dict,
+                           analysis_date: Optional[str], report_date: str) -> List:
         """Create the title page"""
         story = []
         
@@ -133,22 +277,22 @@ class ReportGenerator:
         story.append(Spacer(1, 0.5*inch))
         
         # Property identifier
-        property_info = data.get('property_info', {})
         address = property_info.get('raw_input', {}).get('address', 'Property Address Not Available')
         
         story.append(Paragraph(f"Property: {address}", self.styles['Subtitle']))
         story.append(Spacer(1, 0.3*inch))
         
         # Municipality
-        municipality_info = data.get('municipality_info', {})
         municipality_name = municipality_info.get('name', 'Municipality Not Identified')
         
         story.append(Paragraph(f"Municipality: {municipality_name}", self.styles['Heading2']))
         story.append(Spacer(1, 0.5*inch))
         
         # Report details
-        analysis_date = data.get('analysis_date', datetime.now().isoformat())
-        formatted_date = datetime.fromisoformat(analysis_date.replace('Z', '+00:00')).strftime('%B %d, %Y')
+        if analysis_date:
+            formatted_date = datetime.fromisoformat(analysis_date.replace('Z', '+00:00')).strftime(REPORT_DATE_FORMAT)
+        else:
+            formatted_date = report_date
         
         report_info = [
             f"Report Date: {formatted_date}",
@@ -163,17 +307,12 @@ class ReportGenerator:
         story.append(Spacer(1, 1*inch))
         
         # Disclaimer
-        disclaimer = """
-        <b>DISCLAIMER:</b> This report is based on publicly available information and automated analysis. 
-        It is intended for preliminary assessment purposes only. All information should be verified with 
-        the appropriate municipal authorities before making any development decisions. This report does 
-        not constitute professional planning or legal advice.
-        """
-        story.append(Paragraph(disclaimer, self.styles['Highlight']))
+        story.append(copy(_DISCLAIMER_PARAGRAPH))
         
         return story
     
-    def _create_executive_summary(self, data: Dict) -> List:
+    def _create_executive_summary(self, feasibility_summary: Dict, municipality_info: Dict,
+                                  policy_info: Dict, report_date: str) -> List:
         """Create executive summary section"""
         story = []
         
@@ -181,29 +320,19 @@ class ReportGenerator:
         story.append(Spacer(1, 0.3*inch))
         
         # Feasibility summary
-        feasibility_summary = data.get('feasibility_summary', {})
         development_potential = feasibility_summary.get('development_potential', 'Unknown')
         
         # Create summary table
         summary_data = [
             ['Assessment Category', 'Result'],
             ['Development Potential', development_potential],
-            ['Municipality', data.get('municipality_info', {}).get('name', 'Not Identified')],
-            ['Primary Zoning', data.get('policy_info', {}).get('zoning', 'Not Determined')],
-            ['Report Date', datetime.now().strftime('%B %d, %Y')]
+            ['Municipality', municipality_info.get('name', 'Not Identified')],
+            ['Primary Zoning', policy_info.get('zoning', 'Not Determined')],
+            ['Report Date', report_date]
         ]
         
-        summary_table = Table(summary_data, colWidths=[3*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table = Table(summary_data, colWidths=_EVEN_COLUMNS)
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         
         story.append(summary_table)
         story.append(Spacer(1, 0.3*inch))
@@ -213,8 +342,7 @@ class ReportGenerator:
         
         key_considerations = feasibility_summary.get('key_considerations', [])
         if key_considerations:
-            for consideration in key_considerations[:5]:  # Limit to top 5
-                story.append(Paragraph(f"• {consideration}", self.styles['Normal']))
+            story.append(_bullet_list(key_considerations[:5], self.styles['Normal']))  # Limit to top 5
         else:
             story.append(Paragraph("• Detailed analysis required to determine key considerations", self.styles['Normal']))
         
@@ -225,19 +353,21 @@ class ReportGenerator:
         
         recommended_actions = feasibility_summary.get('recommended_actions', [])
         if recommended_actions:
-            for i, action in enumerate(recommended_actions[:3], 1):  # Top 3 actions
-                story.append(Paragraph(f"{i}. {action}", self.styles['Normal']))
+            story.append(_numbered_list(recommended_actions[:3], self.styles['Normal']))  # Top 3 actions
         
         return story
     
-    def _create_property_section(self, data: Dict) -> List:
+    def _create_property_section(self, property_info: Dict) -> List:
         """Create property information section"""
+        # Leave the section out entirely when there is nothing to show
+        if not property_info:
+            return []
+        
         story = []
         
         story.append(Paragraph("Property Information", self.styles['Subtitle']))
         story.append(Spacer(1, 0.2*inch))
         
-        property_info = data.get('property_info', {})
         raw_input = property_info.get('raw_input', {})
         
         # Basic property details
@@ -251,7 +381,12 @@ class ReportGenerator:
         # Add coordinates if available
         coordinates = property_info.get('coordinates')
         if coordinates:
-            lat_lon = f"{coordinates.get('latitude', 'N/A'):.6f}, {coordinates.get('longitude', 'N/A'):.6f}"
+            latitude = coordinates.get('latitude')
+            longitude = coordinates.get('longitude')
+            if isinstance(latitude, (int, float)) and isinstance(longitude, (int, float)):
+                lat_lon = f"{latitude:.6f}, {longitude:.6f}"
+            else:
+                lat_lon = 'N/A'
             property_details.append(['Coordinates', lat_lon])
         
         # Add property characteristics
@@ -259,14 +394,8 @@ class ReportGenerator:
         if property_chars.get('acreage'):
             property_details.append(['Acreage', f"{property_chars['acreage']} acres"])
         
-        property_table = Table(property_details, colWidths=[2*inch, 4*inch])
-        property_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        property_table = Table(property_details, colWidths=_LABEL_COLUMNS)
+        property_table.setStyle(_PROPERTY_TABLE_STYLE)
         
         story.append(property_table)
         story.append(Spacer(1, 0.2*inch))
@@ -280,19 +409,17 @@ class ReportGenerator:
         
         return story
     
-    def _create_municipality_section(self, data: Dict) -> List:
+    def _create_municipality_section(self, municipality_info: Dict) -> List:
         """Create municipality information section"""
+        # Leave the section out entirely when there is nothing to show
+        if not municipality_info:
+            return []
+        
         story = []
         
         story.append(Paragraph("Municipality Information", self.styles['Subtitle']))
         story.append(Spacer(1, 0.2*inch))
         
-        municipality_info = data.get('municipality_info', {})
-        
-        if not municipality_info:
-            story.append(Paragraph("Municipality information not available.", self.styles['Normal']))
-            return story
-        
         # Basic municipality details
         muni_details = [
             ['Municipality', municipality_info.get('name', 'Not identified')],
@@ -301,16 +428,12 @@ class ReportGenerator:
         ]
         
         # Add population if available
-        if municipality_info.get('population'):
-            muni_details.append(['Population', f"{municipality_info['population']:,}"])
+        population = municipality_info.get('population')
+        if population:
+            muni_details.append(['Population', f"{population:,}" if isinstance(population, int) else str(population)])
         
-        muni_table = Table(muni_details, colWidths=[2*inch, 4*inch])
-        muni_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        muni_table = Table(muni_details, colWidths=_LABEL_COLUMNS)
+        muni_table.setStyle(_DETAIL_TABLE_STYLE)
         
         story.append(muni_table)
         story.append(Spacer(1, 0.2*inch))
@@ -329,30 +452,23 @@ class ReportGenerator:
                 contact_details.append(['Planning Department', municipality_info['planning_dept']])
             
             if contact_details:
-                contact_table = Table(contact_details, colWidths=[2*inch, 4*inch])
-                contact_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                contact_table = Table(contact_details, colWidths=_LABEL_COLUMNS)
+                contact_table.setStyle(_DETAIL_TABLE_STYLE)
                 story.append(contact_table)
         
         return story
     
-    def _create_policy_section(self, data: Dict) -> List:
+    def _create_policy_section(self, policy_info: Dict) -> List:
         """Create zoning and policy analysis section"""
+        # Leave the section out entirely when there is nothing to show
+        if not policy_info:
+            return []
+        
         story = []
         
         story.append(Paragraph("Zoning and Policy Analysis", self.styles['Subtitle']))
         story.append(Spacer(1, 0.2*inch))
         
-        policy_info = data.get('policy_info', {})
-        
-        if not policy_info:
-            story.append(Paragraph("Policy information not available.", self.styles['Normal']))
-            return story
-        
         # Zoning information
         zoning = policy_info.get('zoning')
         if zoning:
@@ -364,24 +480,21 @@ class ReportGenerator:
         permitted_uses = policy_info.get('permitted_uses', [])
         if permitted_uses:
             story.append(Paragraph("Permitted Uses", self.styles['SectionHeader']))
-            for use in permitted_uses:
-                story.append(Paragraph(f"• {use}", self.styles['Normal']))
+            story.append(_bullet_list(permitted_uses, self.styles['Normal']))
             story.append(Spacer(1, 0.1*inch))
         
         # Discretionary uses
         discretionary_uses = policy_info.get('discretionary_uses', [])
         if discretionary_uses:
             story.append(Paragraph("Discretionary Uses", self.styles['SectionHeader']))
-            for use in discretionary_uses:
-                story.append(Paragraph(f"• {use}", self.styles['Normal']))
+            story.append(_bullet_list(discretionary_uses, self.styles['Normal']))
             story.append(Spacer(1, 0.1*inch))
         
         # Development requirements
         dev_requirements = policy_info.get('development_requirements', [])
         if dev_requirements:
             story.append(Paragraph("Development Requirements", self.styles['SectionHeader']))
-            for requirement in dev_requirements:
-                story.append(Paragraph(f"• {requirement}", self.styles['Normal']))
+            story.append(_bullet_list(dev_requirements, self.styles['Normal']))
             story.append(Spacer(1, 0.1*inch))
         
         # Setbacks and restrictions
@@ -393,39 +506,27 @@ class ReportGenerator:
             story.append(Paragraph("Development Standards", self.styles['SectionHeader']))
             
             standards_data = [['Standard', 'Requirement']]
-            
-            for key, value in setbacks.items():
-                standards_data.append([f"{key.title()} Setback", value])
-            
-            for key, value in density.items():
-                standards_data.append([key.replace('_', ' ').title(), value])
-            
-            for key, value in height.items():
-                standards_data.append([key.replace('_', ' ').title(), value])
+            standards_data.extend([f"{_format_label(key)} Setback", value] for key, value in setbacks.items())
+            standards_data.extend(
+                [_format_label(key), value]
+                for restrictions in (density, height)
+                for key, value in restrictions.items()
+            )
             
             if len(standards_data) > 1:
-                standards_table = Table(standards_data, colWidths=[3*inch, 3*inch])
-                standards_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                standards_table = Table(standards_data, colWidths=_EVEN_COLUMNS)
+                standards_table.setStyle(_HEADER_TABLE_STYLE)
                 story.append(standards_table)
         
         return story
     
-    def _create_development_analysis(self, data: Dict) -> List:
+    def _create_development_analysis(self, cottage_analysis: Dict) -> List:
         """Create development analysis section"""
         story = []
         
         story.append(Paragraph("Development Analysis", self.styles['Subtitle']))
         story.append(Spacer(1, 0.2*inch))
         
-        cottage_analysis = data.get('cottage_analysis', {})
-        
         # Development feasibility
         feasibility = cottage_analysis.get('feasibility', 'Unknown')
         story.append(Paragraph(f"<b>Development Feasibility:</b> {feasibility}", self.styles['Highlight']))
@@ -438,54 +539,37 @@ class ReportGenerator:
             
             potential_data = []
             for key, value in cottage_potential.items():
-                formatted_key = key.replace('_', ' ').title()
+                formatted_key = _format_label(key)
                 potential_data.append([formatted_key, str(value)])
             
             if potential_data:
-                potential_table = Table(potential_data, colWidths=[3*inch, 3*inch])
-                potential_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
+                potential_table = Table(potential_data, colWidths=_EVEN_COLUMNS)
+                potential_table.setStyle(_DETAIL_TABLE_STYLE)
                 story.append(potential_table)
         
         return story
     
-    def _create_recommendations_section(self, data: Dict) -> List:
+    def _create_recommendations_section(self, feasibility_summary: Dict) -> List:
         """Create recommendations and next steps section"""
         story = []
         
         story.append(Paragraph("Recommendations and Next Steps", self.styles['Subtitle']))
         story.append(Spacer(1, 0.2*inch))
         
-        feasibility_summary = data.get('feasibility_summary', {})
         recommended_actions = feasibility_summary.get('recommended_actions', [])
         
         if recommended_actions:
             story.append(Paragraph("Recommended Actions", self.styles['SectionHeader']))
-            for i, action in enumerate(recommended_actions, 1):
-                story.append(Paragraph(f"{i}. {action}", self.styles['Normal']))
+            story.append(_numbered_list(recommended_actions, self.styles['Normal']))
             story.append(Spacer(1, 0.2*inch))
         
         # Additional recommendations
         story.append(Paragraph("Additional Considerations", self.styles['SectionHeader']))
-        additional_recommendations = [
-            "Engage a qualified land use planner for detailed analysis",
-            "Conduct environmental due diligence assessments",
-            "Verify all utility capacities and connection costs",
-            "Review neighboring property developments and restrictions",
-            "Consider market analysis for proposed development type",
-            "Evaluate financing options and development timeline"
-        ]
-        
-        for recommendation in additional_recommendations:
-            story.append(Paragraph(f"• {recommendation}", self.styles['Normal']))
+        story.append(copy(_ADDITIONAL_CONSIDERATIONS_PARAGRAPH))
         
         return story
     
-    def _create_appendices(self, data: Dict) -> List:
+    def _create_appendices(self, municipality_info: Dict) -> List:
         """Create appendices section"""
         story = []
         
@@ -495,8 +579,6 @@ class ReportGenerator:
         # Appendix A: Data sources
         story.append(Paragraph("Appendix A: Data Sources and References", self.styles['SectionHeader']))
         
-        municipality_info = data.get('municipality_info', {})
-        
         references = [
             "Alberta Land-use Framework (landuse.alberta.ca)",
             "Municipal Government Act (MGA)",
@@ -509,24 +591,17 @@ class ReportGenerator:
         if municipality_info.get('land_use_bylaw'):
             references.append(f"Land Use Bylaw: {municipality_info['land_use_bylaw']}")
         
-        for reference in references:
-            story.append(Paragraph(f"• {reference}", self.styles['Normal']))
+        story.append(_bullet_list(references, self.styles['Normal']))
         
         story.append(Spacer(1, 0.3*inch))
         
         # Appendix B: Methodology
         story.append(Paragraph("Appendix B: Analysis Methodology", self.styles['SectionHeader']))
         
-        methodology_text = """
-        This feasibility study was conducted using the Alberta Land Use Feasibility Tool, which employs 
-        automated analysis of publicly available municipal data, zoning information, and land use policies. 
-        The analysis includes property identification, municipality lookup, zoning classification, and 
-        policy interpretation based on standard Alberta municipal planning practices.
-        
-        The tool provides preliminary assessments based on available data and should be supplemented 
-        with professional planning consultation and municipal verification for final development decisions.
-        """
-        
-        story.append(Paragraph(methodology_text, self.styles['Normal']))
+        story.append(copy(_METHODOLOGY_PARAGRAPH))
         
         return story
+
+def render_report(analysis_data: Dict) -> bytes:
+    """Render a report to PDF bytes; importable by name so worker processes can run it"""
+    return ReportGenerator().create_report_bytes(analysis_data)
@@ -7,14 +7,27 @@ Run this file to start the web application
 import os
 from app import app
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 if __name__ == '__main__':
-    # Create necessary directories
-    os.makedirs('reports', exist_ok=True)
-    os.makedirs('logs', exist_ok=True)
+    # Create necessary directories next to the app, where gunicorn's --chdir runs it
+    os.makedirs(os.path.join(BASE_DIR, 'reports'), exist_ok=True)
+    os.makedirs(os.path.join(BASE_DIR, 'logs'), exist_ok=True)
     
-    # Run the application
-    app.run(
-        debug=True,
-        host='0.0.0.0',
-        port=5000
-    )
+    if os.environ.get('FLASK_ENV') == 'development' or os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true'):
+        # Werkzeug's debug server, for local development only
+        app.run(
+            debug=True,
+            host='0.0.0.0',
+            port=5000
+        )
+    else:
+        # Hand the process over to gunicorn, which serves requests from a pool
+        # of workers using the settings in gunicorn.conf.py
+        os.execvp('gunicorn', [
+            'gunicorn',
+            '--chdir', BASE_DIR,
+            '--config', os.path.join(BASE_DIR, 'gunicorn.conf.py'),
+            '--bind', '0.0.0.0:5000',
+            'wsgi:app'
+        ])
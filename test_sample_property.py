@@ -4,156 +4,275 @@ Test script for the Alberta Land Use Tool using the sample property data
 This demonstrates how the tool would analyze the cottage development property
 """
 
-import json
+import io
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
 from property_parser import PropertyParser
 from municipality_lookup import MunicipalityLookup
-from policy_retrieval import PolicyRetrieval
-from report_generator import ReportGenerator
+
+# Components are built once and reused by every run in the same process
+@lru_cache(maxsize=1)
+def _parser():
+    return PropertyParser()
+
+@lru_cache(maxsize=1)
+def _municipality_lookup():
+    return MunicipalityLookup()
+
+@lru_cache(maxsize=1)
+def _policy_retrieval():
+    from policy_retrieval import PolicyRetrieval
+    return PolicyRetrieval()
+
+@lru_cache(maxsize=1)
+def _report_generator():
+    # ReportLab is only loaded once a report is actually rendered
+    from report_generator import ReportGenerator
+    return ReportGenerator()
+
+# Municipality used when the sample property can't be matched
+FALLBACK_MUNICIPALITY = "Wetaskiwin County"
+
+@lru_cache(maxsize=1)
+def _fallback_municipality():
+    return _municipality_lookup()._find_by_name(FALLBACK_MUNICIPALITY)
+
+# Renders the PDF while the summary is printed
+_REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+def reset_components():
+    """Discard the shared components so the next run builds fresh ones"""
+    for factory in (_parser, _municipality_lookup, _policy_retrieval, _report_generator, _fallback_municipality):
+        factory.cache_clear()
+
+# Sample data from the email, with the description's indentation stripped once
+_SAMPLE_DATA = {
+    "address": "Property north of Black Bull Golf, west of The Village at Pigeon Lake, AB",
+    "legal_description": "14.55 acre rural commercial property",  # Would need actual legal description
+    "additional_info": textwrap.dedent("""
+    14.55 acre rural commercial property directly North of Black Bull Golf and west of The Village at Pigeon Lake. 
+    Plan to develop the north section of the property with small cottages for rent. The cottages would range 
+    600-800sq ft per unit and ideally 4-5 cottages per acre. Start small (4-5 cottages) and develop the land 
+    over the course of many years. The south (5+/- acres) should be something other than cottages.
+
+    The county just installed a septic lift station to the north. The septic pipes and power line are in place 
+    along the edge of our property. There's no village water, so everyone drills for it. The hwy has turning 
+    lanes from both directions that lead onto the county road which accesses our property. There's a 
+    ravine/creek along the eastern portion of the property.
+
+    Neighbouring property to the north consist of .3 acre rv lots for sale.
+    """).strip()
+}
+
+def _compile_results(property_info, municipality_info, policy_info, cottage_analysis):
+    """Combine the outputs of each analysis step into one results dictionary"""
+    return {
+        'property_info': property_info,
+        'municipality_info': municipality_info,
+        'policy_info': policy_info,
+        'cottage_analysis': cottage_analysis,
+        'feasibility_summary': {
+            'development_potential': cottage_analysis.get('feasibility', 'Unknown'),
+            'key_considerations': cottage_analysis.get('regulatory_considerations', ()),
+            'recommended_actions': cottage_analysis.get('next_steps', ())
+        }
+    }
+
+def run_analyses(samples):
+    """
+    Analyze several properties with the shared components
+    
+    Args:
+        samples: Dictionaries with optional 'address', 'legal_description'
+            and 'additional_info' entries
+        
+    Returns:
+        Results for each sample in input order, or None where a sample has no input
+    """
+    # Geocode every address in one batch before analyzing the properties
+    parsed = _parser().parse_many(samples)
+    municipality_lookup = _municipality_lookup()
+    policy_retrieval = _policy_retrieval()
+    
+    results = []
+    for property_info in parsed:
+        if property_info is None:
+            results.append(None)
+            continue
+        
+        municipality_info = municipality_lookup.find_municipality(property_info) or _fallback_municipality()
+        policy_info = policy_retrieval.get_land_use_policies(municipality_info, property_info)
+        cottage_analysis = policy_retrieval.get_cottage_development_analysis(
+            policy_info,
+            property_info.get('property_details', {})
+        )
+        results.append(_compile_results(property_info, municipality_info, policy_info, cottage_analysis))
+    
+    return results
 
 def test_sample_property():
     """Test the tool with the sample property from the email"""
     
-    print("🏡 Alberta Land Use Feasibility Tool - Sample Property Test")
-    print("=" * 60)
+    # Collect the walkthrough in memory and write it to stdout in one go
+    out = io.StringIO()
+    emit = partial(print, file=out)
     
-    # Sample data from the email
-    sample_data = {
-        "address": "Property north of Black Bull Golf, west of The Village at Pigeon Lake, AB",
-        "legal_description": "14.55 acre rural commercial property",  # Would need actual legal description
-        "additional_info": """
-        14.55 acre rural commercial property directly North of Black Bull Golf and west of The Village at Pigeon Lake. 
-        Plan to develop the north section of the property with small cottages for rent. The cottages would range 
-        600-800sq ft per unit and ideally 4-5 cottages per acre. Start small (4-5 cottages) and develop the land 
-        over the course of many years. The south (5+/- acres) should be something other than cottages.
-        
-        The county just installed a septic lift station to the north. The septic pipes and power line are in place 
-        along the edge of our property. There's no village water, so everyone drills for it. The hwy has turning 
-        lanes from both directions that lead onto the county road which accesses our property. There's a 
-        ravine/creek along the eastern portion of the property.
-        
-        Neighbouring property to the north consist of .3 acre rv lots for sale.
-        """
-    }
+    emit("🏡 Alberta Land Use Feasibility Tool - Sample Property Test")
+    emit("=" * 60)
     
     # Initialize components
-    print("🔧 Initializing analysis components...")
-    property_parser = PropertyParser()
-    municipality_lookup = MunicipalityLookup()
-    policy_retrieval = PolicyRetrieval()
-    report_generator = ReportGenerator()
+    emit("🔧 Initializing analysis components...")
+    property_parser = _parser()
+    municipality_lookup = _municipality_lookup()
     
     try:
         # Step 1: Parse property information
-        print("\n📍 Step 1: Parsing property information...")
+        emit("\n📍 Step 1: Parsing property information...")
         property_info = property_parser.parse_property_info(
-            address=sample_data["address"],
-            legal_description=sample_data["legal_description"],
-            additional_info=sample_data["additional_info"]
+            address=_SAMPLE_DATA["address"],
+            legal_description=_SAMPLE_DATA["legal_description"],
+            additional_info=_SAMPLE_DATA["additional_info"]
         )
         
         if property_info:
-            print("✅ Property information parsed successfully")
-            print(f"   - Property details found: {len(property_info.get('property_details', {}))} characteristics")
-            print(f"   - Municipality hints: {property_info.get('municipality_hints', [])}")
-            if property_info.get('property_details', {}).get('acreage'):
-                print(f"   - Acreage: {property_info['property_details']['acreage']} acres")
+            property_details = property_info.get('property_details', {})
+            emit("✅ Property information parsed successfully")
+            emit(f"   - Property details found: {len(property_details)} characteristics")
+            emit(f"   - Municipality hints: {property_info.get('municipality_hints', [])}")
+            if property_details.get('acreage'):
+                emit(f"   - Acreage: {property_details['acreage']} acres")
         else:
-            print("❌ Failed to parse property information")
+            emit("❌ Failed to parse property information")
             return
         
         # Step 2: Lookup municipality
-        print("\n🏛️ Step 2: Looking up municipality...")
+        emit("\n🏛️ Step 2: Looking up municipality...")
         municipality_info = municipality_lookup.find_municipality(property_info)
         
         if municipality_info:
-            print("✅ Municipality identified successfully")
-            print(f"   - Municipality: {municipality_info.get('name', 'Unknown')}")
-            print(f"   - Type: {municipality_info.get('type', 'Unknown')}")
-            print(f"   - Website: {municipality_info.get('website', 'Not available')}")
+            emit("✅ Municipality identified successfully")
+            emit(f"   - Municipality: {municipality_info.get('name', 'Unknown')}")
+            emit(f"   - Type: {municipality_info.get('type', 'Unknown')}")
+            emit(f"   - Website: {municipality_info.get('website', 'Not available')}")
         else:
-            print("⚠️ Municipality not identified - using Wetaskiwin County as fallback")
+            emit(f"⚠️ Municipality not identified - using {FALLBACK_MUNICIPALITY} as fallback")
             # Use fallback municipality for demonstration
-            municipality_info = municipality_lookup._find_by_name("Wetaskiwin County")
+            municipality_info = _fallback_municipality()
         
         # Step 3: Retrieve policies and zoning
-        print("\n📋 Step 3: Retrieving land use policies...")
+        emit("\n📋 Step 3: Retrieving land use policies...")
+        policy_retrieval = _policy_retrieval()
         policy_info = policy_retrieval.get_land_use_policies(municipality_info, property_info)
         
-        print("✅ Policy information retrieved")
-        print(f"   - Zoning: {policy_info.get('zoning', 'Not determined')}")
-        print(f"   - Permitted uses: {len(policy_info.get('permitted_uses', []))} found")
-        print(f"   - Development requirements: {len(policy_info.get('development_requirements', []))} found")
+        emit("✅ Policy information retrieved")
+        emit(f"   - Zoning: {policy_info.get('zoning', 'Not determined')}")
+        emit(f"   - Permitted uses: {len(policy_info.get('permitted_uses', []))} found")
+        emit(f"   - Development requirements: {len(policy_info.get('development_requirements', []))} found")
         
         # Step 4: Cottage development analysis
-        print("\n🏘️ Step 4: Analyzing cottage development potential...")
+        emit("\n🏘️ Step 4: Analyzing cottage development potential...")
         cottage_analysis = policy_retrieval.get_cottage_development_analysis(
             policy_info, 
-            property_info.get('property_details', {})
+            property_details
         )
         
-        print("✅ Cottage development analysis completed")
-        print(f"   - Feasibility: {cottage_analysis.get('feasibility', 'Unknown')}")
+        emit("✅ Cottage development analysis completed")
+        emit(f"   - Feasibility: {cottage_analysis.get('feasibility', 'Unknown')}")
         
         cottage_potential = cottage_analysis.get('cottage_potential', {})
         if cottage_potential:
-            print(f"   - Estimated cottage units: {cottage_potential.get('estimated_cottage_units', 'Unknown')}")
-            print(f"   - Recommended Phase 1: {cottage_potential.get('recommended_phase_1', 'Unknown')} units")
+            emit(f"   - Estimated cottage units: {cottage_potential.get('estimated_cottage_units', 'Unknown')}")
+            emit(f"   - Recommended Phase 1: {cottage_potential.get('recommended_phase_1', 'Unknown')} units")
         
         # Step 5: Compile results
-        print("\n📊 Step 5: Compiling analysis results...")
-        
-        results = {
-            'property_info': property_info,
-            'municipality_info': municipality_info,
-            'policy_info': policy_info,
-            'cottage_analysis': cottage_analysis,
-            'feasibility_summary': {
-                'development_potential': cottage_analysis.get('feasibility', 'Unknown'),
-                'key_considerations': cottage_analysis.get('regulatory_considerations', []),
-                'recommended_actions': cottage_analysis.get('next_steps', [])
-            }
-        }
+        emit("\n📊 Step 5: Compiling analysis results...")
+        
+        results = _compile_results(property_info, municipality_info, policy_info, cottage_analysis)
+        
+        # Pull the summary fields out once for the printout
+        summary = results['feasibility_summary']
+        feasibility = summary['development_potential']
+        considerations = summary['key_considerations']
+        next_steps = summary['recommended_actions']
+        
+        # Start the PDF report now so it renders while the summary is printed
+        report_future = _REPORT_EXECUTOR.submit(_report_generator().create_report, results)
         
         # Display summary
-        print("\n" + "=" * 60)
-        print("📈 FEASIBILITY ANALYSIS SUMMARY")
-        print("=" * 60)
+        emit("\n" + "=" * 60)
+        emit("📈 FEASIBILITY ANALYSIS SUMMARY")
+        emit("=" * 60)
         
-        print(f"🏢 Municipality: {municipality_info.get('name', 'Not identified')}")
-        print(f"🏗️ Development Potential: {cottage_analysis.get('feasibility', 'Unknown')}")
-        print(f"📏 Property Size: {property_info.get('property_details', {}).get('acreage', 'Unknown')} acres")
-        print(f"🏘️ Zoning: {policy_info.get('zoning', 'Not determined')}")
+        emit(f"🏢 Municipality: {municipality_info.get('name', 'Not identified')}")
+        emit(f"🏗️ Development Potential: {feasibility}")
+        emit(f"📏 Property Size: {property_details.get('acreage', 'Unknown')} acres")
+        emit(f"🏘️ Zoning: {policy_info.get('zoning', 'Not determined')}")
         
         if cottage_potential:
-            print(f"🏠 Potential Cottage Units: {cottage_potential.get('estimated_cottage_units', 'Unknown')}")
-            print(f"🚀 Phase 1 Recommendation: {cottage_potential.get('recommended_phase_1', 'Unknown')} units")
+            emit(f"🏠 Potential Cottage Units: {cottage_potential.get('estimated_cottage_units', 'Unknown')}")
+            emit(f"🚀 Phase 1 Recommendation: {cottage_potential.get('recommended_phase_1', 'Unknown')} units")
         
-        print("\n🔑 Key Considerations:")
-        for i, consideration in enumerate(cottage_analysis.get('regulatory_considerations', [])[:5], 1):
-            print(f"   {i}. {consideration}")
+        emit("\n🔑 Key Considerations:")
+        out.writelines(f"   {i}. {consideration}\n" for i, consideration in enumerate(islice(considerations, 5), 1))
         
-        print("\n📋 Next Steps:")
-        for i, step in enumerate(cottage_analysis.get('next_steps', [])[:3], 1):
-            print(f"   {i}. {step}")
+        emit("\n📋 Next Steps:")
+        out.writelines(f"   {i}. {step}\n" for i, step in enumerate(islice(next_steps, 3), 1))
         
         # Step 6: Generate report (optional)
-        print(f"\n📄 Step 6: Generating PDF report...")
+        emit(f"\n📄 Step 6: Generating PDF report...")
         try:
-            report_path = report_generator.create_report(results)
-            print(f"✅ PDF report generated: {report_path}")
+            report_path = report_future.result()
+            emit(f"✅ PDF report generated: {report_path}")
         except Exception as e:
-            print(f"⚠️ Report generation failed: {str(e)}")
+            emit(f"⚠️ Report generation failed: {str(e)}")
         
-        print("\n" + "=" * 60)
-        print("✅ Analysis completed successfully!")
-        print("💡 This demonstrates how the tool would analyze your cottage development property.")
-        print("🌐 Access the web interface at http://localhost:5000 for interactive analysis.")
+        emit("\n" + "=" * 60)
+        emit("✅ Analysis completed successfully!")
+        emit("💡 This demonstrates how the tool would analyze your cottage development property.")
+        emit("🌐 Access the web interface at http://localhost:5000 for interactive analysis.")
         
         return results
         
     except Exception as e:
-        print(f"\n❌ Error during analysis: {str(e)}")
+        emit(f"\n❌ Error during analysis: {str(e)}")
         return None
+    
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+def test_sample_properties(monkeypatch):
+    """Test that a batch of samples comes back in input order"""
+    # Answer geocoding locally so the batch doesn't depend on Nominatim
+    coordinates = {
+        _SAMPLE_DATA["address"]: {'latitude': 52.98, 'longitude': -114.05, 'display_name': 'Pigeon Lake'},
+        "5020 50 Ave, Lacombe, AB": {'latitude': 52.4683, 'longitude': -113.7372, 'display_name': 'Lacombe'}
+    }
+    monkeypatch.setattr(PropertyParser, '_geocode_address', lambda self, address: coordinates.get(address))
+    monkeypatch.setattr('property_parser.NOMINATIM_MIN_DELAY', 0)
+    reset_components()
+    
+    samples = [
+        _SAMPLE_DATA,
+        {},
+        {"address": "", "legal_description": "", "additional_info": ""},
+        {"address": "5020 50 Ave, Lacombe, AB", "additional_info": "5 acre agricultural parcel with a well and septic"}
+    ]
+    
+    results = run_analyses(samples)
+    
+    assert len(results) == len(samples)
+    assert results[1] is None
+    assert results[2] is None
+    for sample, result in zip((samples[0], samples[3]), (results[0], results[3])):
+        property_info = result['property_info']
+        assert property_info['raw_input']['additional_info'] == sample['additional_info']
+        assert property_info['coordinates'] == coordinates[sample['address']]
+    assert results[0]['property_info']['property_details']['acreage'] == 14.55
+    assert results[3]['property_info']['property_details']['acreage'] == 5.0
 
 if __name__ == "__main__":
     test_sample_property()
@@ -0,0 +1,9 @@
+"""
+Alberta Land Use Feasibility Tool - WSGI entry point
+Run with a production server, e.g.: gunicorn wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run()